@@ -1,7 +1,8 @@
 # api.py
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from .models import SessionLocal, ActivityLog, Settings
+from .models import ActivityLog, Settings, get_db
+from .reports import patch_annual_buckets
 from .daily_report_fix import generate_daily_report_html
 from .weekly_report_fix import generate_weekly_report_html
 from typing import List, Optional
@@ -14,15 +15,9 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# ------------------------------------------
-# Dependency: Database session
-# ------------------------------------------
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Column projection used by the report endpoints; querying columns returns
+# lightweight Row tuples instead of ORM instances
+ACTIVITY_LOG_COLUMNS = tuple(ActivityLog.__table__.columns)
 
 # ------------------------------------------
 # Activity Logs Endpoints
@@ -73,6 +68,8 @@ class ActivityLogUpdate(BaseModel):
 def create_activity(activity: ActivityLogCreate, db: Session = Depends(get_db)):
     db_activity = ActivityLog(**activity.model_dump())
     db.add(db_activity)
+    db.flush()
+    patch_annual_buckets(db, db_activity.timestamp, db_activity.group, db_activity.category, db_activity.duration_minutes)
     db.commit()
     db.refresh(db_activity)
     return {k: v for k, v in db_activity.__dict__.items() if k != "_sa_instance_state"}
@@ -90,10 +87,16 @@ def update_activity(activity_id: int, activity_update: ActivityLogUpdate, db: Se
     if not db_activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
+    previous = (db_activity.timestamp, db_activity.group, db_activity.category, db_activity.duration_minutes)
+
     update_data = activity_update.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_activity, key, value)
 
+    db.flush()
+    # Move the activity out of its old bucket and into the new one
+    patch_annual_buckets(db, *previous, removed=True)
+    patch_annual_buckets(db, db_activity.timestamp, db_activity.group, db_activity.category, db_activity.duration_minutes)
     db.commit()
     db.refresh(db_activity)
     return {k: v for k, v in db_activity.__dict__.items() if k != "_sa_instance_state"}
@@ -103,7 +106,10 @@ def delete_activity(activity_id: int, db: Session = Depends(get_db)):
     db_activity = db.query(ActivityLog).filter(ActivityLog.id == activity_id).first()
     if not db_activity:
         raise HTTPException(status_code=404, detail="Activity not found")
+    deleted = (db_activity.timestamp, db_activity.group, db_activity.category, db_activity.duration_minutes)
     db.delete(db_activity)
+    db.flush()
+    patch_annual_buckets(db, *deleted, removed=True)
     db.commit()
     return {"message": "Activity deleted successfully"}
 
@@ -120,16 +126,13 @@ def generate_weekly_report(db: Session = Depends(get_db)):
         start_date = end_date - timedelta(days=7)
         
         # Fetch activity logs for the date range
-        logs = db.query(ActivityLog).filter(
+        rows = db.query(*ACTIVITY_LOG_COLUMNS).filter(
             ActivityLog.timestamp >= datetime.combine(start_date, time.min),
             ActivityLog.timestamp <= datetime.combine(end_date, time.max)
         ).all()
         
-        # Convert logs to dictionary format for processing
-        logs_data = [
-            {k: v for k, v in log.__dict__.items() if k != "_sa_instance_state"}
-            for log in logs
-        ]
+        # Convert rows to dictionary format for processing
+        logs_data = [dict(row._mapping) for row in rows]
         
         # Generate the report using the existing logic
         html_report = generate_weekly_report_html(
@@ -191,16 +194,13 @@ def generate_daily_report(request: DailyReportRequest = None, db: Session = Depe
         logger.info(f"Generating daily report from {start_date} to {end_date}")
         
         # Fetch activity logs for the date range
-        logs = db.query(ActivityLog).filter(
+        rows = db.query(*ACTIVITY_LOG_COLUMNS).filter(
             ActivityLog.timestamp >= start_date,
             ActivityLog.timestamp <= end_date
         ).all()
         
-        # Convert logs to dictionary format for processing
-        logs_data = [
-            {k: v for k, v in log.__dict__.items() if k != "_sa_instance_state"}
-            for log in logs
-        ]
+        # Convert rows to dictionary format for processing
+        logs_data = [dict(row._mapping) for row in rows]
         
         # Generate the report using existing logic
         html_report = generate_daily_report_html(
@@ -1,20 +1,26 @@
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))  # Add project root to path
 
+import httpx
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from fastapi.testclient import TestClient
 
 # Import models and app after path is set
-from activitylogger.backend.models import Base, init_default_settings, backup_database
+from activitylogger.backend.models import Base, ActivityLog, init_default_settings, backup_database
 from activitylogger.backend.api import get_db as actual_get_db
 from activitylogger.backend.main import app
+from activitylogger.backend import config, custom_reports, report_fix_middleware, reports, scheduler
 
-# Use file-based SQLite for tests to avoid in-memory database issues
-TEST_DB_PATH = "/tmp/test_activity_logger.db"
+# Use file-based SQLite for tests to avoid in-memory database issues.
+# Each pytest-xdist worker (pytest -n auto) gets its own database file.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DB_PATH = f"/tmp/test_activity_logger_{WORKER_ID}.db"
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
 
 # Create engine with aggressive connection recycling
@@ -24,6 +30,14 @@ test_engine = create_engine(
     pool_pre_ping=True
 )
 
+@event.listens_for(test_engine, "connect")
+def set_test_sqlite_pragmas(dbapi_connection, connection_record):
+    """The test database is disposable, so skip fsyncs and keep the journal in memory"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.close()
+
 # Create session factory
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
@@ -57,6 +71,38 @@ setup_test_db()
 def pytest_sessionfinish(session, exitstatus):
     teardown_test_db()
 
+REPORT_PERIODS = ("daily", "weekly", "monthly", "quarterly", "annual")
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_reports_dirs(tmp_path_factory):
+    """Point every report directory at a temporary tree for this session.
+    
+    The report modules bind their directories at import time, so they are
+    patched in place. tmp_path_factory gives each pytest-xdist worker its own
+    tree, so parallel workers never touch each other's (or the user's) reports.
+    """
+    base = tmp_path_factory.mktemp("reports")
+    dirs = {period: base / period for period in REPORT_PERIODS}
+    for directory in dirs.values():
+        directory.mkdir()
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(reports, "REPORTS_BASE_DIR", str(base))
+        mp.setattr(reports, "REPORTS_DIR", str(dirs["daily"]))
+        mp.setattr(scheduler, "REPORTS_BASE_DIR", str(base))
+        mp.setattr(scheduler, "DAILY_REPORTS_DIR", str(dirs["daily"]))
+        for period in REPORT_PERIODS[1:]:
+            name = f"{period.upper()}_REPORTS_DIR"
+            mp.setattr(reports, name, str(dirs[period]))
+            mp.setattr(scheduler, name, str(dirs[period]))
+            mp.setattr(report_fix_middleware, name, dirs[period])
+        for period, directory in dirs.items():
+            mp.setitem(reports.REPORT_DIRS, period, str(directory))
+        mp.setattr(report_fix_middleware, "REPORTS_DIR", base)
+        mp.setattr(config, "REPORTS_DIR", str(dirs["daily"]))
+        mp.setattr(custom_reports, "WEEKLY_REPORTS_DIR", str(dirs["weekly"]))
+        yield base
+
 @pytest.fixture(scope="function")
 def db():
     """Create a fresh database session for each test."""
@@ -84,10 +130,49 @@ def db():
             transaction.rollback()
         connection.close()
 
+@pytest.fixture(scope="module")
+def sample_activity():
+    """Commit one activity shared by a module's read-only tests.
+    
+    It is written outside the per-test savepoint so the per-test rollbacks
+    leave it in place, and it is removed when the module finishes.
+    """
+    session = TestingSessionLocal()
+    activity = ActivityLog(
+        timestamp=datetime(2023, 1, 1, 10, 0, 0),
+        description="Shared test activity",
+        category="Work",
+        group="Test Group",
+        duration_minutes=60
+    )
+    session.add(activity)
+    session.commit()
+    data = {
+        "id": activity.id,
+        "timestamp": activity.timestamp,
+        "description": activity.description,
+        "category": activity.category,
+        "group": activity.group,
+        "duration_minutes": activity.duration_minutes
+    }
+    try:
+        yield data
+    finally:
+        session.delete(activity)
+        session.commit()
+        session.close()
+
+@pytest.fixture(scope="session")
+def app_client():
+    """Start the app once and share its test client across the whole session."""
+    with TestClient(app) as test_client:
+        yield test_client
+
 @pytest.fixture(scope="function")
-def client(db):
+def client(app_client, db):
     """Create a test client that uses the test database."""
-    # Override the get_db dependency
+    # Override the get_db dependency; each test still gets its own
+    # rolled-back db session even though the client is shared
     def override_get_db():
         try:
             yield db
@@ -96,8 +181,14 @@ def client(db):
     
     app.dependency_overrides[actual_get_db] = override_get_db
     
-    with TestClient(app) as test_client:
-        yield test_client
+    yield app_client
     
     # Clean up overrides
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture
+async def async_client(client):
+    """Async client for the in-process app, sharing the client fixture's db override."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
@@ -2,10 +2,10 @@ import json
 import logging
 import os
 import traceback
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, date, time
 from fastapi import APIRouter, Query, HTTPException
 from pydantic import BaseModel
-from sqlalchemy import and_
 from .models import SessionLocal, ActivityLog, Settings
 from .report_templates import DailyTimeBreakdown, ChartData, generate_html_report
 from .reports import WeeklyReport, generate_weekly_report
@@ -14,6 +14,9 @@ from .reports import WeeklyReport, generate_weekly_report
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Custom weekly reports are written alongside the regular weekly reports
+WEEKLY_REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "reports", "weekly")
+
 # Create a router for the custom reports
 router = APIRouter()
 
@@ -37,7 +40,6 @@ async def get_custom_weekly_report(date: str, force_refresh: bool = Query(True,
         logger.info(f"Generating custom weekly report for week {start_date} to {end_date}")
 
         # Create the report directory if it doesn't exist
-        WEEKLY_REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../reports/weekly")
         os.makedirs(WEEKLY_REPORTS_DIR, exist_ok=True)
 
         # Define the report filename
@@ -68,7 +70,7 @@ async def get_custom_weekly_report(date: str, force_refresh: bool = Query(True,
         with SessionLocal() as db:
             logs = db.query(ActivityLog).filter(
                 ActivityLog.timestamp >= datetime.combine(start_date, time.min),
-                ActivityLog.timestamp <= datetime.combine(end_date, time.max)
+                ActivityLog.timestamp < datetime.combine(end_date + timedelta(days=1), time.min)
             ).all()
 
         if not logs:
@@ -79,60 +81,46 @@ async def get_custom_weekly_report(date: str, force_refresh: bool = Query(True,
         logs_data = [{
             "group": log.group,
             "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+            "timestamp": log.timestamp.isoformat(sep=' ', timespec='milliseconds'),
             "duration_minutes": log.duration_minutes,
             "description": log.description
         } for log in logs]
 
         # Calculate total time and time by group/category
         total_time = sum(log["duration_minutes"] for log in logs_data)
-        time_by_group = {}
-        time_by_category = {}
-        daily_breakdown = {}
-
-        # Initialize daily breakdown for each day of the week
-        current_date = start_date
-        while current_date <= end_date:
-            day_str = current_date.strftime("%Y-%m-%d")
-            daily_breakdown[day_str] = DailyTimeBreakdown(
-                total_time=0,
-                time_by_group={},
-                time_by_category={}
-            )
-            current_date += timedelta(days=1)
+        time_by_group = Counter()
+        time_by_category = Counter()
+        daily_totals = Counter()
+        daily_groups = defaultdict(Counter)
+        daily_categories = defaultdict(Counter)
 
         # Process each log
         for log in logs_data:
             group = log["group"]
             category = log["category"]
             duration = log["duration_minutes"]
-            log_date = datetime.strptime(log["timestamp"].split()[0], "%Y-%m-%d").date()
-            day_str = log_date.strftime("%Y-%m-%d")
+            # The timestamp string starts with its ISO date, no need to re-parse it
+            day_str = log["timestamp"][:10]
 
-            # Update time by group
-            if group not in time_by_group:
-                time_by_group[group] = 0
             time_by_group[group] += duration
-
-            # Update time by category
-            if category not in time_by_category:
-                time_by_category[category] = 0
             time_by_category[category] += duration
+            daily_totals[day_str] += duration
+            daily_groups[day_str][group] += duration
+            daily_categories[day_str][category] += duration
 
-            # Update daily breakdown
-            if day_str in daily_breakdown:
-                daily_time = daily_breakdown[day_str]
-                daily_time.total_time += duration
-
-                # Update group time
-                if group not in daily_time.time_by_group:
-                    daily_time.time_by_group[group] = 0
-                daily_time.time_by_group[group] += duration
-
-                # Update category time
-                if category not in daily_time.time_by_category:
-                    daily_time.time_by_category[category] = 0
-                daily_time.time_by_category[category] += duration
+        # Build the daily breakdown for each day of the period, including empty days
+        daily_breakdown = {}
+        current_date = start_date
+        while current_date <= end_date:
+            day_str = current_date.strftime("%Y-%m-%d")
+            daily_breakdown[day_str] = DailyTimeBreakdown(
+                total_time=daily_totals[day_str],
+                time_by_group=dict(daily_groups.get(day_str, {})),
+                time_by_category=dict(daily_categories.get(day_str, {}))
+            )
+            current_date += timedelta(days=1)
+        time_by_group = dict(time_by_group)
+        time_by_category = dict(time_by_category)
 
         # Use the LLM to generate the report
         try:
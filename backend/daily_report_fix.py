@@ -6,7 +6,6 @@ import json
 import logging
 import os
 from datetime import datetime, date, time
-from sqlalchemy import and_
 from .models import SessionLocal, ActivityLog
 from .report_templates import generate_html_report, ChartData, DailyTimeBreakdown
 
@@ -1,21 +1,24 @@
 import json
 import logging
 import httpx
+import orjson
 import re
 from datetime import datetime
 from typing import Optional
-from .models import SessionLocal, Settings
+from .models import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Error bodies (e.g. an HTML page when no model is loaded) are truncated to this many bytes
+LLM_ERROR_BODY_LIMIT = 512
+
 async def call_llm_api(prompt: str, max_retries: int = 3, model_type: str = "logs") -> dict:
     """Call LLM API and return parsed JSON response with improved retry logic"""
-    db = SessionLocal()
     retry_count = 0
     last_error = None
 
     try:
-        settings = db.query(Settings).first()
+        settings = get_settings()
         if not settings:
             logger.error("LLM API call failed: Settings not configured")
             raise ValueError("Settings not configured")
@@ -67,12 +70,15 @@ async def call_llm_api(prompt: str, max_retries: int = 3, model_type: str = "log
                     response = await client.post(url, json=payload, headers=headers)
 
                     if response.status_code != 200:
-                        error_msg = f"LLM API error (HTTP {response.status_code}): {response.text}"
+                        body = response.content[:LLM_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+                        error_msg = f"LLM API error (HTTP {response.status_code}): {body}"
                         logger.error(error_msg)
                         raise ValueError(error_msg)
 
                     logger.debug("Received response from LLM API")
-                    result = response.json()
+                    # Decode the envelope bytes once with orjson rather than
+                    # through httpx's charset sniffing + stdlib json path
+                    result = orjson.loads(response.content)
 
                     if 'choices' not in result or len(result['choices']) == 0:
                         raise ValueError(f"Invalid response format from LLM API: {result}")
@@ -109,8 +115,6 @@ async def call_llm_api(prompt: str, max_retries: int = 3, model_type: str = "log
     except Exception as e:
         logger.error(f"LLM API call failed: {str(e)}")
         raise
-    finally:
-        db.close()
 
 # Refactored extract_json_from_response with state machine approach
 def extract_json_from_response(response: str) -> dict:
@@ -2,18 +2,20 @@
 import logging
 import sys
 import os
+from contextlib import asynccontextmanager
 
 # Add the parent directory to the Python path to allow imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from . import recording
 from . import api  # Import the router from api.py
 from . import reports
 from . import custom_reports
 from . import scheduler  # Import the scheduler module
-from .scheduler import start_scheduler
+from .scheduler import start_scheduler, stop_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -28,7 +30,17 @@ try:
 except Exception as e:
     logger.error(f"Error loading report fix middleware: {e}")
 
-app = FastAPI(title="ActivityLogger API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the report scheduler on the app's event loop for the app's lifetime."""
+    start_scheduler()
+    try:
+        yield
+    finally:
+        stop_scheduler()
+
+# Serialize responses with orjson instead of the stdlib json encoder
+app = FastAPI(title="ActivityLogger API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Add CORS middleware to allow requests from your frontend
 app.add_middleware(
@@ -63,7 +75,6 @@ async def debug_routes():
 async def root():
     return {"message": "ActivityLogger API is running."}
 
-# Ensure old startup event is completely removed
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
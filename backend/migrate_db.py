@@ -21,6 +21,12 @@ def migrate():
                     print("Added 'category' column to 'activity_logs' table.")
             else:
                 print("'category' column already exists in 'activity_logs' table.")
+            with session.bind.begin() as conn:
+                conn.execute(text(
+                    'CREATE INDEX IF NOT EXISTS ix_activity_logs_timestamp '
+                    'ON activity_logs (timestamp, "group", category, duration_minutes);'
+                ))
+                print("Ensured 'ix_activity_logs_timestamp' index on 'activity_logs' table.")
         else:
             print("Table 'activity_logs' does not exist.")
 
@@ -3,7 +3,7 @@ from datetime import datetime
 import json
 import logging
 import atexit
-from sqlalchemy import Column, Integer, String, DateTime, Text, create_engine, event
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker, Session, Mapped, mapped_column
 from typing import List, Dict, Any, Optional, Union, TypedDict, Literal
 import sqlite3
@@ -29,14 +29,27 @@ logger.info(f"Using database at: {DB_PATH}")
 logger.info(f"Database exists: {os.path.exists(DB_PATH)}")
 logger.info(f"Database size: {os.path.getsize(DB_PATH) if os.path.exists(DB_PATH) else 0} bytes")
 
-# Create the engine with increased timeout for LLM operations
+# Create the engine with increased timeout for LLM operations and a
+# bounded connection pool shared by all request handlers
 engine = create_engine(
     DATABASE_URL,
     connect_args={
         "check_same_thread": False,
         "timeout": 60
-    }
+    },
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True
 )
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so readers don't block on the frequent small activity writes"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 # Add after engine creation
 logging.basicConfig()
 logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
@@ -61,6 +74,14 @@ def safe_init_database(engine_to_use):
 # Create a configured "SessionLocal" class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Dependency: yields a pooled session and returns it to the pool afterwards
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
 # Base class for our models
 Base = declarative_base()
 
@@ -73,6 +94,12 @@ class ActivityLog(Base):
     duration_minutes = Column(Integer)
     description = Column(String)
 
+    # Date-range filters on timestamp become index range scans, and the
+    # trailing columns let the report aggregations read from the index alone
+    __table_args__ = (
+        Index('ix_activity_logs_timestamp', 'timestamp', 'group', 'category', 'duration_minutes'),
+    )
+
 # Pydantic model for category group mapping
 class CategoryGroup(TypedDict):
     name: str
@@ -247,6 +274,36 @@ class ReportCache(Base):
             logger.error(f"Error parsing report data: {e}")
             return {}
 
+# Settings change rarely, so callers that only read them reuse a detached copy
+# until the database files change on disk
+_settings_cache = None
+
+def _db_files_signature():
+    """mtimes of the database file and its WAL (writes land in the WAL first)"""
+    signature = []
+    for path in (DB_PATH, DB_PATH + "-wal"):
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+def get_settings():
+    """Return the Settings row, reloading it only when the database has been written"""
+    global _settings_cache
+    signature = _db_files_signature()
+    if _settings_cache is not None and _settings_cache[0] == signature:
+        return _settings_cache[1]
+
+    db = SessionLocal()
+    try:
+        settings = db.query(Settings).first()
+    finally:
+        db.close()
+    if settings is not None:
+        _settings_cache = (signature, settings)
+    return settings
+
 
 # Ensure default settings exist
 # Modify the initialization code
@@ -13,6 +13,7 @@ import yaml
 from .models import SessionLocal, ActivityLog, Settings
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 from .llm_service import call_llm_api, extract_json_from_response  # Import both functions
+from .reports import patch_annual_buckets
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -102,6 +103,7 @@ def save_activity_logs(activity_logs: list):
 
         logger.info(f"Saving {len(validated_logs)} activity logs to database")
 
+        new_logs = []
         for activity in validated_logs:
             # Get the data from the activity (either a Pydantic model or a dict)
             if isinstance(activity, Activity):
@@ -124,8 +126,13 @@ def save_activity_logs(activity_logs: list):
                 )
 
             db.add(new_log)
+            new_logs.append(new_log)
             logger.info(f"Adding activity to database: {new_log.category}/{new_log.group} - {new_log.duration_minutes} minutes")
 
+        db.flush()
+        for new_log in new_logs:
+            patch_annual_buckets(db, new_log.timestamp, new_log.group, new_log.category, new_log.duration_minutes)
+
         db.commit()
         logger.info(f"Successfully committed {len(validated_logs)} activity logs to database")
     except Exception as e:
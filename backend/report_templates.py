@@ -1,5 +1,6 @@
 import json
 import logging
+from collections import defaultdict
 from datetime import date
 from pydantic import BaseModel, Field, ConfigDict
 
@@ -837,16 +838,9 @@ def generate_html_report(start_date: date, end_date: date, total_time: float, ti
     """
 
     # Generate combined group/category data for the totals table
-    combined_data = {}
+    combined_data = defaultdict(int)
     for log in logs_data:
-        group = log.get("group", "Other")
-        category = log.get("category", "Other")
-        duration = log["duration_minutes"]
-
-        key = (group, category)
-        if key not in combined_data:
-            combined_data[key] = 0
-        combined_data[key] += duration
+        combined_data[log.get("group", "Other"), log.get("category", "Other")] += log["duration_minutes"]
 
     # Sort by group then by time spent
     sorted_combined = sorted(combined_data.items(), key=lambda x: (x[0][0], -x[1]))
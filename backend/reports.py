@@ -1,16 +1,24 @@
 import os
+import asyncio
 import json
+import orjson
+import functools
 import logging
 import yaml
 import random
 import re
+import tempfile
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, date, time
+# Alias for handlers whose "date" query parameter shadows the class
+from datetime import date as date_class
 from fastapi import HTTPException
-from sqlalchemy import and_
-from .models import SessionLocal, ActivityLog, Settings, ReportCache
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+from .models import SessionLocal, ActivityLog, Settings, ReportCache, get_db
 from .config import get_categories_json
-from fastapi import APIRouter, Query, HTTPException, Response
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
+from fastapi.responses import RedirectResponse, ORJSONResponse, FileResponse
 from pydantic import BaseModel, Field, ValidationError, ConfigDict
 import httpx
 import sys
@@ -140,6 +148,19 @@ REPORT_DIRS = {
     'annual': ANNUAL_REPORTS_DIR
 }
 
+# Per-day annual aggregates live in the report_cache table under this type, so
+# they belong to the database they were computed from
+ANNUAL_BUCKETS_CACHE_TYPE = "annual_buckets"
+
+# Candidate filenames for a report of each type, tried in order for a given date
+REPORT_FILENAME_PATTERNS = {
+    'daily': ("daily_report_{date}.json", "{date}_report.json"),
+    'weekly': ("weekly_report_{date}.json", "{date}_weekly_report.json"),
+    'monthly': ("monthly_report_{date}.json", "{date}_monthly_report.json"),
+    'quarterly': ("quarterly_report_{date}.json", "{date}_quarterly_report.json"),
+    'annual': ("annual_report_{date}.json", "{date}_annual_report.json")
+}
+
 # Create all report directories
 for directory in [REPORTS_DIR, WEEKLY_REPORTS_DIR, MONTHLY_REPORTS_DIR,
                   QUARTERLY_REPORTS_DIR, ANNUAL_REPORTS_DIR]:
@@ -148,6 +169,46 @@ for directory in [REPORTS_DIR, WEEKLY_REPORTS_DIR, MONTHLY_REPORTS_DIR,
 
 router = APIRouter()
 
+# In-memory cache for report files served by the GET endpoints. Entries are
+# keyed on (full path, parser) and validated against the file's mtime and
+# size, so regenerated reports are picked up without explicit invalidation.
+REPORT_CACHE_MAX_ENTRIES = 64
+_report_file_cache = {}
+
+def load_report_cached(file_path: str, parse=None):
+    """Return the (optionally parsed) contents of a report file, reusing the
+    cached value while the file on disk is unchanged."""
+    file_stats = os.stat(file_path)
+    key = (os.path.abspath(file_path), parse)
+    signature = (file_stats.st_mtime_ns, file_stats.st_size)
+
+    cached = _report_file_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    value = parse(content) if parse else content
+
+    if len(_report_file_cache) >= REPORT_CACHE_MAX_ENTRIES:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _report_file_cache.pop(next(iter(_report_file_cache)))
+    _report_file_cache[key] = (signature, value)
+    return value
+
+@functools.lru_cache(maxsize=8)
+def _scan_json_reports(report_dir: str, mtime_ns: int) -> tuple:
+    with os.scandir(report_dir) as entries:
+        return tuple(sorted(e.name for e in entries if e.name.endswith('.json') and e.is_file()))
+
+def list_json_reports(report_dir: str) -> tuple:
+    """Return the sorted JSON report filenames in a directory.
+
+    The scan is cached per directory and keyed on the directory mtime, which
+    advances whenever a report is added, removed or renamed.
+    """
+    return _scan_json_reports(report_dir, os.stat(report_dir).st_mtime_ns)
+
 @router.get("/list-reports/{report_type}")
 async def list_reports(report_type: str):
     """List all available reports of a specific type.
@@ -332,7 +393,7 @@ async def generate_daily_report_for_date(report_date, logs_data):
         }
 
 @router.post("/force-daily-report")
-async def force_daily_report(date_str: str = Query(..., alias="date")):
+async def force_daily_report(date_str: str = Query(..., alias="date"), db: Session = Depends(get_db)):
     """Force generates a report for a specific date using actual DB data."""
     logger.info(f"Entering force_daily_report with date: {date_str}")
     try:
@@ -341,31 +402,33 @@ async def force_daily_report(date_str: str = Query(..., alias="date")):
         report_date = date(year, month, day)
         logger.info(f"Force generating report for date: {report_date}")
 
-        db = SessionLocal()
-        try:
-            # Steps 1-3 remain the same...
-            start_date = datetime.combine(report_date, time.min)
-            end_date = datetime.combine(report_date + timedelta(days=1), time.min)
-            logger.info(f"Query range: start={start_date.isoformat()}, end={end_date.isoformat()}")
-
-            query = db.query(ActivityLog).filter(
-                ActivityLog.timestamp >= start_date,
-                ActivityLog.timestamp < end_date
-            )
-            activities = query.all()
-
-            logs_data = [
-                {
-                    "group": activity.group,
-                    "timestamp": activity.timestamp.isoformat(),
-                    "duration_minutes": activity.duration_minutes,
-                    "description": activity.description or ""
-                }
-                for activity in activities
-            ]
-
-        finally:
-            db.close()
+        # Steps 1-3 remain the same...
+        start_date = datetime.combine(report_date, time.min)
+        end_date = datetime.combine(report_date + timedelta(days=1), time.min)
+        logger.info(f"Query range: start={start_date.isoformat()}, end={end_date.isoformat()}")
+
+        # Select only the needed columns so rows come back as plain tuples
+        # rather than identity-tracked ORM instances
+        query = db.query(
+            ActivityLog.group,
+            ActivityLog.timestamp,
+            ActivityLog.duration_minutes,
+            ActivityLog.description
+        ).filter(
+            ActivityLog.timestamp >= start_date,
+            ActivityLog.timestamp < end_date
+        )
+        rows = query.all()
+
+        logs_data = [
+            {
+                "group": group,
+                "timestamp": timestamp.isoformat(),
+                "duration_minutes": duration_minutes,
+                "description": description or ""
+            }
+            for group, timestamp, duration_minutes, description in rows
+        ]
 
         # Step 4: Generate Report - Add await here
         logger.info(f"Generating report with {len(logs_data)} activities")
@@ -1586,7 +1649,7 @@ async def debug_reports():
         return {"error": str(e)}
 
 @router.get("/monthly-report")
-async def get_monthly_report(date: str = Query(...), force_refresh: bool = Query(False)):
+async def get_monthly_report(date: str = Query(...), force_refresh: bool = Query(False), db: Session = Depends(get_db)):
     """Get the monthly report for the month containing the specified date.
     If force_refresh is True, regenerate the report even if it already exists."""
     logger.info(f"Monthly report requested for date: {date}, force_refresh: {force_refresh}")
@@ -1604,8 +1667,6 @@ async def get_monthly_report(date: str = Query(...), force_refresh: bool = Query
         try:
             year, month, day = map(int, date.split('-'))
             logger.info(f"Parsed date components: year={year}, month={month}, day={day}")
-            # Import the date class explicitly to avoid name conflicts
-            from datetime import date as date_class
             target_date = date_class(year, month, day)
             logger.info(f"Created target_date: {target_date}")
         except Exception as e:
@@ -1656,100 +1717,83 @@ async def get_monthly_report(date: str = Query(...), force_refresh: bool = Query
                 logger.info(f"No monthly report found for {month_name} {year}, generating a new one")
 
             # Get activity logs for the month
-            db = SessionLocal()
             start_datetime = datetime.combine(first_day, time.min)
-            end_datetime = datetime.combine(last_day, time.max)
-
-            try:
-                logs = db.query(ActivityLog).filter(
-                    and_(
-                        ActivityLog.timestamp >= start_datetime,
-                        ActivityLog.timestamp <= end_datetime
-                    )
-                ).all()
-
-                # Convert logs to the format expected by the report generator
-                logs_data = [{
-                    "group": log.group,
-                    "category": log.category,
-                    "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                    "duration_minutes": log.duration_minutes,
-                    "description": log.description
-                } for log in logs]
+            end_datetime = datetime.combine(last_day + timedelta(days=1), time.min)
 
-                if logs_data:
-                    # Generate the monthly report using the report_templates module
-                    from report_templates import generate_html_report
-
-                    # Create time breakdown for the month
-                    daily_breakdown = {}
+            logs = db.query(ActivityLog).filter(
+                and_(
+                    ActivityLog.timestamp >= start_datetime,
+                    ActivityLog.timestamp < end_datetime
+                )
+            ).all()
 
-                    # Process logs to create time breakdowns by day
-                    for log in logs_data:
-                        log_date = datetime.strptime(log["timestamp"], "%Y-%m-%d %H:%M:%S.%f").date().strftime("%Y-%m-%d")
-                        if log_date not in daily_breakdown:
-                            daily_breakdown[log_date] = DailyTimeBreakdown(total_time=0, time_by_group={}, time_by_category={})
-
-                        # Update daily breakdown
-                        daily_time = daily_breakdown[log_date]
-                        daily_time.total_time += log["duration_minutes"]
-
-                        # Update group time
-                        if log["group"] not in daily_time.time_by_group:
-                            daily_time.time_by_group[log["group"]] = 0
-                        daily_time.time_by_group[log["group"]] += log["duration_minutes"]
-
-                        # Update category time
-                        if log["category"] not in daily_time.time_by_category:
-                            daily_time.time_by_category[log["category"]] = 0
-                        daily_time.time_by_category[log["category"]] += log["duration_minutes"]
-
-                    # Calculate total time and time breakdowns
-                    total_time = sum(log["duration_minutes"] for log in logs_data)
-                    time_by_group = {}
-                    time_by_category = {}
-
-                    # Process logs to create time breakdowns by group and category
-                    for log in logs_data:
-                        # Update group time
-                        if log["group"] not in time_by_group:
-                            time_by_group[log["group"]] = 0
-                        time_by_group[log["group"]] += log["duration_minutes"]
-
-                        # Update category time
-                        if log["category"] not in time_by_category:
-                            time_by_category[log["category"]] = 0
-                        time_by_category[log["category"]] += log["duration_minutes"]
-
-                    # Create visualizations dictionary
-                    visualizations = {}
-
-                    # Generate the HTML report
-                    html_report = generate_html_report(
-                        start_date=first_day,
-                        end_date=last_day,
-                        total_time=total_time,
-                        time_by_group=time_by_group,
-                        time_by_category=time_by_category,
-                        daily_breakdown=daily_breakdown,
-                        visualizations=visualizations,
-                        logs_data=logs_data
+            # Convert logs to the format expected by the report generator
+            logs_data = [{
+                "group": log.group,
+                "category": log.category,
+                "timestamp": log.timestamp.isoformat(sep=' ', timespec='milliseconds'),
+                "duration_minutes": log.duration_minutes,
+                "description": log.description
+            } for log in logs]
+
+            if logs_data:
+                # Generate the monthly report using the report_templates module
+                # Create time breakdowns for the month in one pass over the logs
+                total_time = 0
+                time_by_group = Counter()
+                time_by_category = Counter()
+                daily_totals = Counter()
+                daily_groups = defaultdict(Counter)
+                daily_categories = defaultdict(Counter)
+
+                for log in logs_data:
+                    log_date = log["timestamp"][:10]
+                    duration = log["duration_minutes"]
+                    total_time += duration
+                    time_by_group[log["group"]] += duration
+                    time_by_category[log["category"]] += duration
+                    daily_totals[log_date] += duration
+                    daily_groups[log_date][log["group"]] += duration
+                    daily_categories[log_date][log["category"]] += duration
+
+                daily_breakdown = {
+                    log_date: DailyTimeBreakdown(
+                        total_time=day_total,
+                        time_by_group=dict(daily_groups[log_date]),
+                        time_by_category=dict(daily_categories[log_date])
                     )
+                    for log_date, day_total in daily_totals.items()
+                }
+                time_by_group = dict(time_by_group)
+                time_by_category = dict(time_by_category)
+
+                # Create visualizations dictionary
+                visualizations = {}
+
+                # Generate the HTML report
+                html_report = generate_html_report(
+                    start_date=first_day,
+                    end_date=last_day,
+                    total_time=total_time,
+                    time_by_group=time_by_group,
+                    time_by_category=time_by_category,
+                    daily_breakdown=daily_breakdown,
+                    visualizations=visualizations,
+                    logs_data=logs_data
+                )
+
+                # Create the monthly report object
+                report = MonthlyReport(html_report=html_report)
+
+                # Save the report
+                with open(report_path, 'w') as f:
+                    json.dump(report.model_dump(), f, indent=2)
 
-                    # Create the monthly report object
-                    report = MonthlyReport(html_report=html_report)
-
-                    # Save the report
-                    with open(report_path, 'w') as f:
-                        json.dump(report.model_dump(), f, indent=2)
-
-                    logger.info(f"Monthly report saved to {report_path}")
-                    return report.model_dump()
-                else:
-                    logger.warning(f"No activity logs found for {month_name} {year}")
-                    raise HTTPException(status_code=404, detail=f"No activity logs found for {month_name} {year}")
-            finally:
-                db.close()
+                logger.info(f"Monthly report saved to {report_path}")
+                return report.model_dump()
+            else:
+                logger.warning(f"No activity logs found for {month_name} {year}")
+                raise HTTPException(status_code=404, detail=f"No activity logs found for {month_name} {year}")
 
     except HTTPException:
         raise
@@ -1760,7 +1804,7 @@ async def get_monthly_report(date: str = Query(...), force_refresh: bool = Query
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/quarterly-report")
-async def get_quarterly_report(date: str = Query(...)):
+async def get_quarterly_report(date: str = Query(...), db: Session = Depends(get_db)):
     """Get the quarterly report for the quarter containing the specified date."""
     try:
         # Log starting debug info
@@ -1770,8 +1814,6 @@ async def get_quarterly_report(date: str = Query(...)):
         try:
             year, month, day = map(int, date.split('-'))
             logger.info(f"Parsed date components: year={year}, month={month}, day={day}")
-            # Import the date class explicitly to avoid name conflicts
-            from datetime import date as date_class
             target_date = date_class(year, month, day)
             logger.info(f"Created target_date: {target_date}")
         except Exception as e:
@@ -1823,76 +1865,56 @@ async def get_quarterly_report(date: str = Query(...)):
             logger.info(f"No quarterly report found for Q{quarter} {year}, generating a new one")
 
             # Get activity logs for the quarter
-            db = SessionLocal()
             start_datetime = datetime.combine(first_day, time.min)
-            end_datetime = datetime.combine(last_day, time.max)
-
-            try:
-                logs = db.query(ActivityLog).filter(
-                    and_(
-                        ActivityLog.timestamp >= start_datetime,
-                        ActivityLog.timestamp <= end_datetime
-                    )
-                ).all()
-
-                # Convert logs to the format expected by the report generator
-                logs_data = [{
-                    "group": log.group,
-                    "category": log.category,
-                    "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                    "duration_minutes": log.duration_minutes,
-                    "description": log.description
-                } for log in logs]
-
-                if logs_data:
-                    # Generate the quarterly report using the report_templates module
-                    from report_templates import generate_html_report
-
-                    # Create chart data and time breakdown for the quarter
-                    chart_data = ChartData()
-                    daily_breakdown = {}
-
-                    # Process logs to create time breakdowns by day
-                    for log in logs_data:
-                        log_date = datetime.strptime(log["timestamp"], "%Y-%m-%d %H:%M:%S.%f").date().strftime("%Y-%m-%d")
-                        if log_date not in daily_breakdown:
-                            daily_breakdown[log_date] = DailyTimeBreakdown(total_time=0, time_by_group={}, time_by_category={})
-
-                        # Update daily breakdown
-                        daily_time = daily_breakdown[log_date]
-                        daily_time.total_time += log["duration_minutes"]
-
-                        # Update group time
-                        if log["group"] not in daily_time.time_by_group:
-                            daily_time.time_by_group[log["group"]] = 0
-                        daily_time.time_by_group[log["group"]] += log["duration_minutes"]
-
-                        # Update category time
-                        if log["category"] not in daily_time.time_by_category:
-                            daily_time.time_by_category[log["category"]] = 0
-                        daily_time.time_by_category[log["category"]] += log["duration_minutes"]
-
-                        # Update chart data
-                        chart_data.add_activity(log)
-
-                    # Generate the HTML report
-                    title = f"Quarterly Activity Report - Q{quarter} {year}"
-                    html_report = generate_html_report(title, first_day, last_day, logs_data, chart_data, daily_breakdown)
+            end_datetime = datetime.combine(last_day + timedelta(days=1), time.min)
 
-                    # Create the quarterly report object
-                    report = QuarterlyReport(html_report=html_report)
+            logs = db.query(ActivityLog).filter(
+                and_(
+                    ActivityLog.timestamp >= start_datetime,
+                    ActivityLog.timestamp < end_datetime
+                )
+            ).all()
 
-                    # Save the report
-                    with open(report_path, 'w') as f:
-                        json.dump(report.model_dump(), f, indent=2)
+            # Convert logs to the format expected by the report generator
+            logs_data = [{
+                "group": log.group,
+                "category": log.category,
+                "timestamp": log.timestamp.isoformat(sep=' ', timespec='milliseconds'),
+                "duration_minutes": log.duration_minutes,
+                "description": log.description
+            } for log in logs]
+
+            if logs_data:
+                # Aggregate per day/group/category in SQL; logs_data is only
+                # needed for the activity table in the HTML report
+                total_time, time_by_group, time_by_category, daily_breakdown = aggregate_activity_buckets(
+                    db, start_datetime, end_datetime
+                )
+
+                # Generate the HTML report
+                html_report = generate_html_report(
+                    start_date=first_day,
+                    end_date=last_day,
+                    total_time=total_time,
+                    time_by_group=time_by_group,
+                    time_by_category=time_by_category,
+                    daily_breakdown=daily_breakdown,
+                    visualizations={},
+                    logs_data=logs_data
+                )
+
+                # Create the quarterly report object
+                report = QuarterlyReport(html_report=html_report)
+
+                # Save the report
+                with open(report_path, 'w') as f:
+                    json.dump(report.model_dump(), f, indent=2)
 
-                    logger.info(f"Quarterly report saved to {report_path}")
-                    return report.model_dump()
-                else:
-                    logger.warning(f"No activity logs found for Q{quarter} {year}")
-                    raise HTTPException(status_code=404, detail=f"No activity logs found for Q{quarter} {year}")
-            finally:
-                db.close()
+                logger.info(f"Quarterly report saved to {report_path}")
+                return report.model_dump()
+            else:
+                logger.warning(f"No activity logs found for Q{quarter} {year}")
+                raise HTTPException(status_code=404, detail=f"No activity logs found for Q{quarter} {year}")
 
     except HTTPException:
         raise
@@ -1900,8 +1922,185 @@ async def get_quarterly_report(date: str = Query(...)):
         logger.error(f"Error in get_quarterly_report: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def aggregate_activity_buckets(db: Session, start_datetime: datetime, end_datetime: datetime):
+    """Aggregate activity minutes for a period with a single GROUP BY query.
+
+    The period is half-open: start_datetime <= timestamp < end_datetime.
+
+    Returns (total_time, time_by_group, time_by_category, daily_breakdown),
+    built from one row per (day, group, category) bucket instead of one row
+    per activity.
+    """
+    log_day = func.date(ActivityLog.timestamp)
+    buckets = db.query(
+        log_day,
+        ActivityLog.group,
+        ActivityLog.category,
+        func.sum(ActivityLog.duration_minutes)
+    ).filter(
+        ActivityLog.timestamp >= start_datetime,
+        ActivityLog.timestamp < end_datetime
+    ).group_by(log_day, ActivityLog.group, ActivityLog.category).all()
+
+    total_time = 0
+    time_by_group = {}
+    time_by_category = {}
+    daily_breakdown = {}
+    # Local alias keeps the per-day constructor lookup out of module globals
+    _DTB = DailyTimeBreakdown
+    for log_date, group, category, minutes in buckets:
+        minutes = minutes or 0
+        total_time += minutes
+        time_by_group[group] = time_by_group.get(group, 0) + minutes
+        time_by_category[category] = time_by_category.get(category, 0) + minutes
+
+        daily_time = daily_breakdown.get(log_date)
+        if daily_time is None:
+            daily_time = daily_breakdown[log_date] = _DTB(total_time=0, time_by_group={}, time_by_category={})
+        daily_time.total_time += minutes
+        daily_time.time_by_group[group] = daily_time.time_by_group.get(group, 0) + minutes
+        daily_time.time_by_category[category] = daily_time.time_by_category.get(category, 0) + minutes
+
+    return total_time, time_by_group, time_by_category, daily_breakdown
+
+def annual_fingerprint(db: Session, start_datetime: datetime, end_datetime: datetime):
+    """(row count, total minutes) of the activities in a half-open range.
+
+    This detects activities added or removed and durations changed without
+    going through patch_annual_buckets. It does not detect a group or
+    category edited outside the hooks, since count and minutes stay the same.
+    """
+    count, minutes = db.query(
+        func.count(ActivityLog.id),
+        func.coalesce(func.sum(ActivityLog.duration_minutes), 0)
+    ).filter(
+        ActivityLog.timestamp >= start_datetime,
+        ActivityLog.timestamp < end_datetime
+    ).one()
+    return [count, minutes]
+
+def _annual_buckets_row(db: Session, year: int):
+    return db.query(ReportCache).filter(
+        ReportCache.report_type == ANNUAL_BUCKETS_CACHE_TYPE,
+        ReportCache.date == str(year)
+    ).first()
+
+def load_annual_buckets(db: Session, year: int):
+    """Return (row, stored) for a year's buckets, or (None, None) if not precomputed.
+
+    stored holds the "fingerprint" the buckets were built for, the "days"
+    breakdown and the "rendered" stat of the annual report file built from them.
+    """
+    row = _annual_buckets_row(db, year)
+    if row is None or not row.report_data:
+        return row, None
+    try:
+        return row, orjson.loads(row.report_data)
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Discarding unreadable annual buckets for {year}: {e}")
+        return row, None
+
+def save_annual_buckets(db: Session, year: int, stored: dict, row=None):
+    """Stage a year's buckets on the session; the caller commits."""
+    payload = orjson.dumps(stored, option=orjson.OPT_NON_STR_KEYS).decode()
+    if row is None:
+        row = _annual_buckets_row(db, year)
+    if row is None:
+        db.add(ReportCache(report_type=ANNUAL_BUCKETS_CACHE_TYPE, date=str(year), report_data=payload))
+    else:
+        row.report_data = payload
+
+def totals_from_daily_breakdown(daily_breakdown: dict):
+    """Fold a daily breakdown into (total_time, time_by_group, time_by_category)."""
+    total_time = 0
+    time_by_group = {}
+    time_by_category = {}
+    for daily_time in daily_breakdown.values():
+        total_time += daily_time.total_time
+        for group, minutes in daily_time.time_by_group.items():
+            time_by_group[group] = time_by_group.get(group, 0) + minutes
+        for category, minutes in daily_time.time_by_category.items():
+            time_by_category[category] = time_by_category.get(category, 0) + minutes
+    return total_time, time_by_group, time_by_category
+
+def patch_annual_buckets(db: Session, log_timestamp: datetime, group: str, category: str,
+                         duration_minutes: int, removed: bool = False):
+    """Add one activity to (or remove it from) its year's stored buckets.
+
+    Call this after flushing the activity change and before committing, so the
+    buckets are updated in the same transaction. Only the affected day's
+    counters change; the fingerprint moves with them and the rendered report is
+    marked stale so the next GET rebuilds its HTML. Years without stored
+    buckets are left alone and aggregated from SQL on the next read.
+    """
+    if log_timestamp is None:
+        return
+    year = log_timestamp.year
+    row, stored = load_annual_buckets(db, year)
+    if stored is None:
+        return
+
+    sign = -1 if removed else 1
+    delta = sign * (duration_minutes or 0)
+    day = log_timestamp.strftime("%Y-%m-%d")
+    days = stored["days"]
+    bucket = days.setdefault(day, {"total_time": 0, "time_by_group": {}, "time_by_category": {}})
+    bucket["total_time"] += delta
+    bucket["time_by_group"][group] = bucket["time_by_group"].get(group, 0) + delta
+    bucket["time_by_category"][category] = bucket["time_by_category"].get(category, 0) + delta
+
+    # Drop counters that fell to zero (deleted or moved activities)
+    bucket["time_by_group"] = {k: v for k, v in bucket["time_by_group"].items() if v > 0}
+    bucket["time_by_category"] = {k: v for k, v in bucket["time_by_category"].items() if v > 0}
+    if bucket["total_time"] <= 0:
+        del days[day]
+
+    stored["fingerprint"] = [stored["fingerprint"][0] + sign, stored["fingerprint"][1] + delta]
+    stored["rendered"] = None
+    save_annual_buckets(db, year, stored, row)
+
+# NamedTemporaryFile creates files as 0600, so reports are given the mode a
+# plain open() would have produced; read the process umask once to compute it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_report_bytes(report_path: str, payload: bytes):
+    """Write an already-serialized report to disk (safe to run via asyncio.to_thread).
+
+    The payload goes to a uniquely named temporary file in the same directory
+    that is synced and then renamed over report_path, so a crash mid-write
+    never leaves a truncated report behind and concurrent writers of the same
+    report never share a temporary file. The report keeps the existing file's
+    mode, or the umask default for a new one.
+    """
+    directory, filename = os.path.split(report_path)
+    try:
+        mode = os.stat(report_path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    with tempfile.NamedTemporaryFile(dir=directory or None, prefix=filename + ".", suffix=".tmp",
+                                     delete=False) as f:
+        tmp_path = f.name
+        try:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, report_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _parse_annual_report(content: str) -> dict:
+    return AnnualReport(**orjson.loads(content)).model_dump()
+
 @router.get("/annual-report")
-async def get_annual_report(date: str = Query(...)):
+async def get_annual_report(date: str = Query(...), db: Session = Depends(get_db)):
     """Get the annual report for the year specified in the date."""
     try:
         # Log starting debug info
@@ -1915,109 +2114,106 @@ async def get_annual_report(date: str = Query(...)):
             logger.error(f"Error parsing date: {e}")
             raise HTTPException(status_code=400, detail=f"Invalid date format. Please use YYYY-MM-DD format. Error: {str(e)}")
 
-        # Create the directory for annual reports if it doesn't exist
-        if not os.path.exists(ANNUAL_REPORTS_DIR):
-            os.makedirs(ANNUAL_REPORTS_DIR, exist_ok=True)
-            logger.info(f"Created annual reports directory at {ANNUAL_REPORTS_DIR}")
-
-        # Check for an existing report first
         report_filename = f"annual_report_{year}.json"
         report_path = os.path.join(ANNUAL_REPORTS_DIR, report_filename)
-        logger.info(f"Looking for existing report at: {report_path}")
-
-        if os.path.exists(report_path):
-            logger.info("Found existing report, loading it")
-            try:
-                with open(report_path, 'r') as f:
-                    report_data = json.load(f)
-                # Validate the loaded report using Pydantic
-                report = AnnualReport(**report_data)
-                logger.info("Successfully loaded and validated existing report")
-                return report.model_dump()
-            except Exception as e:
-                logger.error(f"Error loading existing report: {e}")
-                # If there's an error loading the existing report, return a 404
-                raise HTTPException(status_code=404, detail=f"Error loading annual report: {str(e)}")
-        else:
-            # Report doesn't exist, generate a new one
-            logger.info(f"No annual report found for year {year}, generating a new one")
-
-            # Calculate the first and last day of the year
-            from datetime import date as date_class
-            first_day = date_class(year, 1, 1)
-            last_day = date_class(year, 12, 31)
 
-            # Get activity logs for the year
-            db = SessionLocal()
-            start_datetime = datetime.combine(first_day, time.min)
-            end_datetime = datetime.combine(last_day, time.max)
+        # Calculate the first and last day of the year
+        first_day = date_class(year, 1, 1)
+        last_day = date_class(year, 12, 31)
+        start_datetime = datetime.combine(first_day, time.min)
+        end_datetime = datetime.combine(last_day + timedelta(days=1), time.min)
+
+        # The stored buckets are only trusted while their fingerprint matches
+        # this database: rows inserted or deleted, or durations changed around
+        # the activity endpoints, force a rebuild (group/category-only edits
+        # made outside the hooks are not detected)
+        fingerprint = annual_fingerprint(db, start_datetime, end_datetime)
+        if not fingerprint[0]:
+            logger.warning(f"No activity logs found for year {year}")
+            raise HTTPException(status_code=404, detail=f"No activity logs found for year {year}")
+
+        buckets_row, stored = load_annual_buckets(db, year)
+        if stored is None or stored.get("fingerprint") != fingerprint:
+            logger.info(f"Aggregating annual buckets for {year} from the database")
+            _, _, _, daily_breakdown = aggregate_activity_buckets(db, start_datetime, end_datetime)
+            stored = {
+                "fingerprint": fingerprint,
+                "days": {day: bucket.model_dump() for day, bucket in daily_breakdown.items()},
+                "rendered": None
+            }
+            save_annual_buckets(db, year, stored, buckets_row)
+            db.commit()
 
+        # Serve the rendered report only if it is the file built from these buckets
+        try:
+            report_stat = os.stat(report_path)
+            current_render = [report_stat.st_mtime_ns, report_stat.st_size]
+        except FileNotFoundError:
+            current_render = None
+        if current_render is not None and stored.get("rendered") == current_render:
+            logger.info(f"Found up-to-date annual report at {report_path}")
             try:
-                logs = db.query(ActivityLog).filter(
-                    and_(
-                        ActivityLog.timestamp >= start_datetime,
-                        ActivityLog.timestamp <= end_datetime
-                    )
-                ).all()
-
-                # Convert logs to the format expected by the report generator
-                logs_data = [{
-                    "group": log.group,
-                    "category": log.category,
-                    "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-                    "duration_minutes": log.duration_minutes,
-                    "description": log.description
-                } for log in logs]
-
-                if logs_data:
-                    # Generate the annual report using the report_templates module
-                    from report_templates import generate_html_report
-
-                    # Create chart data and time breakdown for the year
-                    chart_data = ChartData()
-                    daily_breakdown = {}
-
-                    # Process logs to create time breakdowns by day
-                    for log in logs_data:
-                        log_date = datetime.strptime(log["timestamp"], "%Y-%m-%d %H:%M:%S.%f").date().strftime("%Y-%m-%d")
-                        if log_date not in daily_breakdown:
-                            daily_breakdown[log_date] = DailyTimeBreakdown(total_time=0, time_by_group={}, time_by_category={})
-
-                        # Update daily breakdown
-                        daily_time = daily_breakdown[log_date]
-                        daily_time.total_time += log["duration_minutes"]
-
-                        # Update group time
-                        if log["group"] not in daily_time.time_by_group:
-                            daily_time.time_by_group[log["group"]] = 0
-                        daily_time.time_by_group[log["group"]] += log["duration_minutes"]
-
-                        # Update category time
-                        if log["category"] not in daily_time.time_by_category:
-                            daily_time.time_by_category[log["category"]] = 0
-                        daily_time.time_by_category[log["category"]] += log["duration_minutes"]
-
-                        # Update chart data
-                        chart_data.add_activity(log)
+                # Validate the loaded report using Pydantic; the validated dump is
+                # cached until the report file changes
+                report_data = load_report_cached(report_path, _parse_annual_report)
+                return ORJSONResponse(report_data)
+            except Exception as e:
+                logger.error(f"Error loading existing report, regenerating it: {e}")
+
+        logger.info(f"Rendering annual report for year {year}")
+        daily_breakdown = {day: DailyTimeBreakdown(**bucket) for day, bucket in stored["days"].items()}
+        total_time, time_by_group, time_by_category = totals_from_daily_breakdown(daily_breakdown)
+
+        # The raw activity table still lists every log, so fetch just the
+        # columns it renders
+        logs = db.query(
+            ActivityLog.group,
+            ActivityLog.category,
+            ActivityLog.timestamp,
+            ActivityLog.duration_minutes,
+            ActivityLog.description
+        ).filter(
+            ActivityLog.timestamp >= start_datetime,
+            ActivityLog.timestamp < end_datetime
+        ).all()
+        logs_data = [{
+            "group": log.group,
+            "category": log.category,
+            "timestamp": log.timestamp.isoformat(sep=' ', timespec='milliseconds'),
+            "duration_minutes": log.duration_minutes,
+            "description": log.description
+        } for log in logs]
+
+        # Generate the annual report using the report_templates module
+        html_report = generate_html_report(
+            start_date=first_day,
+            end_date=last_day,
+            total_time=total_time,
+            time_by_group=time_by_group,
+            time_by_category=time_by_category,
+            daily_breakdown=daily_breakdown,
+            visualizations={},
+            logs_data=logs_data
+        )
 
-                    # Generate the HTML report
-                    title = f"Annual Activity Report - {year}"
-                    html_report = generate_html_report(title, first_day, last_day, logs_data, chart_data, daily_breakdown)
+        # Create the annual report object
+        report = AnnualReport(html_report=html_report)
+        report_data = report.model_dump()
 
-                    # Create the annual report object
-                    report = AnnualReport(html_report=html_report)
+        # Save the report off the event loop
+        os.makedirs(ANNUAL_REPORTS_DIR, exist_ok=True)
+        await asyncio.to_thread(
+            write_report_bytes, report_path, orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
+        )
 
-                    # Save the report
-                    with open(report_path, 'w') as f:
-                        json.dump(report.model_dump(), f, indent=2)
+        # Remember which file these buckets rendered to
+        report_stat = os.stat(report_path)
+        stored["rendered"] = [report_stat.st_mtime_ns, report_stat.st_size]
+        save_annual_buckets(db, year, stored, buckets_row)
+        db.commit()
 
-                    logger.info(f"Annual report saved to {report_path}")
-                    return report.model_dump()
-                else:
-                    logger.warning(f"No activity logs found for year {year}")
-                    raise HTTPException(status_code=404, detail=f"No activity logs found for year {year}")
-            finally:
-                db.close()
+        logger.info(f"Annual report saved to {report_path}")
+        return ORJSONResponse(report_data)
 
     except HTTPException:
         raise
@@ -2026,104 +2222,114 @@ async def get_annual_report(date: str = Query(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/debug-activities")
-async def debug_activities(date: str = Query(...)):
+async def debug_activities(date: str = Query(...), db: Session = Depends(get_db)):
     """Debug endpoint to check activities in database for a specific date."""
     try:
         # Parse date string to date object
         year, month, day = map(int, date.split('-'))
-        report_date = date(year, month, day)
+        report_date = date_class(year, month, day)
         start_date = datetime.combine(report_date, time.min)
         end_date = datetime.combine(report_date + timedelta(days=1), time.min)
 
-        db = SessionLocal()
-        try:
-            activities = db.query(ActivityLog).filter(
-                ActivityLog.timestamp >= start_date,
-                ActivityLog.timestamp < end_date
-            ).all()
+        activities = db.query(ActivityLog).filter(
+            ActivityLog.timestamp >= start_date,
+            ActivityLog.timestamp < end_date
+        ).all()
 
-            return {
-                "date": date,
-                "activities": [
-                    {
-                        "id": activity.id,
-                        "group": activity.group,
-                        "timestamp": activity.timestamp.isoformat(),
-                        "duration_minutes": activity.duration_minutes,
-                        "description": activity.description
-                    }
-                    for activity in activities
-                ]
-            }
-        finally:
-            db.close()
+        return {
+            "date": date,
+            "activities": [
+                {
+                    "id": activity.id,
+                    "group": activity.group,
+                    "timestamp": activity.timestamp.isoformat(),
+                    "duration_minutes": activity.duration_minutes,
+                    "description": activity.description
+                }
+                for activity in activities
+            ]
+        }
 
     except Exception as e:
         logger.error(f"Error in debug_activities: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Upper bound for the debug LLM round trip, retries included
+DEBUG_LLM_TIMEOUT_SECONDS = 15.0
+
 @router.get("/debug-llm")
-async def debug_llm():
+async def debug_llm(db: Session = Depends(get_db)):
     """Debug endpoint to test LLM connectivity and validate JSON extraction."""
     logger.info("Testing LLM connectivity...")
     try:
-        db = SessionLocal()
+        settings = db.query(Settings).first()
+        if not settings:
+            logger.error("No settings found in database")
+            raise ValueError("LLM settings not configured")
+
+        if not settings.lmstudioEndpoint:
+            logger.error("LLM Studio endpoint not configured in settings")
+            raise ValueError("LLM Studio endpoint not configured")
+
+        logger.info(f"Using LLM endpoint: {settings.lmstudioEndpoint}")
+        logger.info(f"Using LLM model: {settings.lmstudioModel or 'default'}")
+
+        # Test basic connectivity
+        test_prompt = "Generate a short test response in JSON format with the following structure: {\"message\": \"your message\", \"timestamp\": \"current time\"}."
+
+        logger.info("Sending test prompt to LLM API...")
         try:
-            settings = db.query(Settings).first()
-            if not settings:
-                logger.error("No settings found in database")
-                raise ValueError("LLM settings not configured")
-
-            if not settings.lmstudioEndpoint:
-                logger.error("LLM Studio endpoint not configured in settings")
-                raise ValueError("LLM Studio endpoint not configured")
-
-            logger.info(f"Using LLM endpoint: {settings.lmstudioEndpoint}")
-            logger.info(f"Using LLM model: {settings.lmstudioModel or 'default'}")
-
-            # Test basic connectivity
-            test_prompt = "Generate a short test response in JSON format with the following structure: {\"message\": \"your message\", \"timestamp\": \"current time\"}."
-
-            logger.info("Sending test prompt to LLM API...")
-            response = await call_llm_api(test_prompt, max_retries=2, model_type="reports")
-            logger.info("Received response from LLM API")
-
-            # Test JSON extraction
-            if isinstance(response, dict) and "choices" in response:
-                logger.info("Testing JSON extraction from response...")
-                content = response["choices"][0]["message"]["content"]
-                extracted_json = extract_json_from_response(content)
-                logger.info("JSON extraction successful")
-
-                return {
-                    "status": "success",
-                    "raw_response": response,
-                    "extracted_json": extracted_json,
-                    "provider_info": {
-                        "type": "lmstudio",
-                        "endpoint": settings.lmstudioEndpoint,
-                        "default_model": settings.lmstudioModel or "default",
-                        "logs_model": settings.lmstudioLogsModel or settings.lmstudioModel or "default",
-                        "reports_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default",
-                        "used_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default"
-                    }
+            # Bound the whole call (including retries) so a hung backend can't pin the worker
+            response = await asyncio.wait_for(
+                call_llm_api(test_prompt, max_retries=2, model_type="reports"),
+                timeout=DEBUG_LLM_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"LLM debug test timed out after {DEBUG_LLM_TIMEOUT_SECONDS} seconds")
+            return {
+                "status": "error",
+                "error": f"LLM request timed out after {DEBUG_LLM_TIMEOUT_SECONDS} seconds",
+                "provider_info": {
+                    "type": "lmstudio",
+                    "endpoint": settings.lmstudioEndpoint
                 }
-            else:
-                # Already got a parsed response
-                return {
-                    "status": "success",
-                    "response": response,
-                    "provider_info": {
-                        "type": "lmstudio",
-                        "endpoint": settings.lmstudioEndpoint,
-                        "default_model": settings.lmstudioModel or "default",
-                        "logs_model": settings.lmstudioLogsModel or settings.lmstudioModel or "default",
-                        "reports_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default",
-                        "used_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default"
-                    }
+            }
+        logger.info("Received response from LLM API")
+
+        # Test JSON extraction
+        if isinstance(response, dict) and "choices" in response:
+            logger.info("Testing JSON extraction from response...")
+            content = response["choices"][0]["message"]["content"]
+            extracted_json = extract_json_from_response(content)
+            logger.info("JSON extraction successful")
+
+            return {
+                "status": "success",
+                "raw_response": response,
+                "extracted_json": extracted_json,
+                "provider_info": {
+                    "type": "lmstudio",
+                    "endpoint": settings.lmstudioEndpoint,
+                    "default_model": settings.lmstudioModel or "default",
+                    "logs_model": settings.lmstudioLogsModel or settings.lmstudioModel or "default",
+                    "reports_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default",
+                    "used_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default"
                 }
-        finally:
-            db.close()
+            }
+        else:
+            # Already got a parsed response
+            return {
+                "status": "success",
+                "response": response,
+                "provider_info": {
+                    "type": "lmstudio",
+                    "endpoint": settings.lmstudioEndpoint,
+                    "default_model": settings.lmstudioModel or "default",
+                    "logs_model": settings.lmstudioLogsModel or settings.lmstudioModel or "default",
+                    "reports_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default",
+                    "used_model": settings.lmstudioReportsModel or settings.lmstudioModel or "default"
+                }
+            }
     except Exception as e:
         logger.error(f"LLM debug test failed: {str(e)}")
         logger.error(traceback.format_exc())
@@ -2133,6 +2339,10 @@ async def debug_llm():
             "traceback": traceback.format_exc()
         }
 
+def _validated_json(content: str) -> str:
+    orjson.loads(content)
+    return content
+
 @router.get("/serve-file/{report_type}/{filename}")
 async def serve_report_file(report_type: str, filename: str):
     """Serve a report file directly (HTML, CSV, etc).
@@ -2177,24 +2387,22 @@ async def serve_report_file(report_type: str, filename: str):
         elif filename.endswith(".json"):
             content_type = "application/json"
 
-        # Read the file content
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
         # For JSON files, we need to ensure they're properly parsed and returned
         if content_type == "application/json":
             try:
-                # Parse JSON to ensure it's valid
-                json_content = json.loads(content)
-                # Return as a JSON response
-                return json_content
+                # Validate the JSON once per file version, then pass the stored
+                # text through as-is instead of re-serializing it
+                content = load_report_cached(file_path, _validated_json)
+                return Response(content=content, media_type="application/json")
             except json.JSONDecodeError as e:
                 logger.error(f"Error parsing JSON file {filename}: {str(e)}")
                 # If parsing fails, return as plain text
-                return Response(content=content, media_type="text/plain")
+                return FileResponse(file_path, media_type="text/plain")
 
-        # Return the file content with appropriate content type
-        return Response(content=content, media_type=content_type)
+        # Stream the file straight from disk (sendfile where available) rather
+        # than reading it into memory; no filename is passed so the browser
+        # renders HTML inline instead of downloading it
+        return FileResponse(file_path, media_type=content_type)
 
     except HTTPException:
         raise
@@ -2203,124 +2411,45 @@ async def serve_report_file(report_type: str, filename: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/export-csv/{report_type}")
-async def export_report_as_csv(report_type: str, date: str = None):
+async def export_report_as_csv(report_type: str, date_str: str = Query(None, alias="date")):
     """Export a report as CSV.
 
     Args:
         report_type: Type of report (daily, weekly, monthly, quarterly, annual)
-        date: Date string in YYYY-MM-DD format for daily reports, or period identifier for others
+        date_str: Date string in YYYY-MM-DD format for daily reports, or period identifier for others
 
     Returns:
         CSV file as a downloadable response
     """
-    valid_types = ["daily", "weekly", "monthly", "quarterly", "annual"]
-    if report_type not in valid_types:
-        raise HTTPException(status_code=400, detail=f"Invalid report type. Must be one of: {', '.join(valid_types)}")
+    if report_type not in REPORT_DIRS:
+        raise HTTPException(status_code=400, detail=f"Invalid report type. Must be one of: {', '.join(REPORT_DIRS)}")
 
     try:
-        # Determine report directory and filename based on type
-        if report_type == "daily":
-            if not date:
-                # Default to yesterday if no date provided
-                current_date = date.today()
-                yesterday = current_date - timedelta(days=1)
-                date = yesterday.strftime("%Y-%m-%d")
-            report_dir = REPORTS_DIR
-
-            # Check both possible filename formats
-            possible_filenames = [f"daily_report_{date}.json", f"{date}_report.json"]
-            report_file = None
-
-            # Log available files in the directory for debugging
-            logger.info(f"Looking for report files in: {report_dir}")
-            available_files = os.listdir(report_dir)
-            logger.info(f"Available files: {available_files}")
-
-            # Try each possible filename
-            for filename in possible_filenames:
-                full_path = os.path.join(report_dir, filename)
-                logger.info(f"Checking if file exists: {full_path}")
-                if os.path.exists(full_path):
-                    report_file = filename
-                    logger.info(f"Found report file: {full_path}")
-                    break
-
+        report_dir = REPORT_DIRS[report_type]
+        if report_type == "daily" and not date_str:
+            # Default to yesterday if no date provided
+            current_date = date.today()
+            yesterday = current_date - timedelta(days=1)
+            date_str = yesterday.strftime("%Y-%m-%d")
+
+        # Log available files in the directory for debugging
+        logger.info(f"Looking for report files in: {report_dir}")
+        available_files = list_json_reports(report_dir)
+        logger.info(f"Available files: {available_files}")
+
+        if not date_str:
+            # Find most recent report
+            if not available_files:
+                raise HTTPException(status_code=404, detail=f"No {report_type} reports found")
+            report_file = available_files[-1]  # Listing is already sorted; ISO-dated names sort chronologically
+        else:
+            # Try each possible filename format against a single directory scan
+            existing_files = set(available_files)
+            possible_filenames = [pattern.format(date=date_str) for pattern in REPORT_FILENAME_PATTERNS[report_type]]
+            report_file = next((name for name in possible_filenames if name in existing_files), None)
             if not report_file:
-                raise HTTPException(status_code=404, detail=f"No daily report found for date: {date}")
-
-        elif report_type == "weekly":
-            report_dir = WEEKLY_REPORTS_DIR
-            # Handle weekly report filename logic
-            if not date:
-                # Find most recent weekly report
-                files = [f for f in os.listdir(report_dir) if f.endswith('.json')]
-                if not files:
-                    raise HTTPException(status_code=404, detail=f"No {report_type} reports found")
-                report_file = sorted(files)[-1]  # Get most recent
-            else:
-                # Try both possible filename formats
-                possible_filenames = [f"weekly_report_{date}.json", f"{date}_weekly_report.json"]
-                report_file = None
-                for filename in possible_filenames:
-                    if os.path.exists(os.path.join(report_dir, filename)):
-                        report_file = filename
-                        break
-                if not report_file:
-                    raise HTTPException(status_code=404, detail=f"No weekly report found for date: {date}")
-        elif report_type == "monthly":
-            report_dir = MONTHLY_REPORTS_DIR
-            # Handle monthly report filename logic
-            if not date:
-                files = [f for f in os.listdir(report_dir) if f.endswith('.json')]
-                if not files:
-                    raise HTTPException(status_code=404, detail=f"No {report_type} reports found")
-                report_file = sorted(files)[-1]  # Get most recent
-            else:
-                # Try both possible filename formats
-                possible_filenames = [f"monthly_report_{date}.json", f"{date}_monthly_report.json"]
-                report_file = None
-                for filename in possible_filenames:
-                    if os.path.exists(os.path.join(report_dir, filename)):
-                        report_file = filename
-                        break
-                if not report_file:
-                    raise HTTPException(status_code=404, detail=f"No monthly report found for date: {date}")
-        elif report_type == "quarterly":
-            report_dir = QUARTERLY_REPORTS_DIR
-            # Handle quarterly report filename logic
-            if not date:
-                files = [f for f in os.listdir(report_dir) if f.endswith('.json')]
-                if not files:
-                    raise HTTPException(status_code=404, detail=f"No {report_type} reports found")
-                report_file = sorted(files)[-1]  # Get most recent
-            else:
-                # Try both possible filename formats
-                possible_filenames = [f"quarterly_report_{date}.json", f"{date}_quarterly_report.json"]
-                report_file = None
-                for filename in possible_filenames:
-                    if os.path.exists(os.path.join(report_dir, filename)):
-                        report_file = filename
-                        break
-                if not report_file:
-                    raise HTTPException(status_code=404, detail=f"No quarterly report found for date: {date}")
-        elif report_type == "annual":
-            report_dir = ANNUAL_REPORTS_DIR
-            # Handle annual report filename logic
-            if not date:
-                files = [f for f in os.listdir(report_dir) if f.endswith('.json')]
-                if not files:
-                    raise HTTPException(status_code=404, detail=f"No {report_type} reports found")
-                report_file = sorted(files)[-1]  # Get most recent
-            else:
-                # Try both possible filename formats
-                possible_filenames = [f"annual_report_{date}.json", f"{date}_annual_report.json"]
-                report_file = None
-                for filename in possible_filenames:
-                    if os.path.exists(os.path.join(report_dir, filename)):
-                        report_file = filename
-                        break
-                if not report_file:
-                    raise HTTPException(status_code=404, detail=f"No annual report found for date: {date}")
+                raise HTTPException(status_code=404, detail=f"No {report_type} report found for date: {date_str}")
+            logger.info(f"Found report file: {os.path.join(report_dir, report_file)}")
 
         # Full path to the report file
         json_path = os.path.join(report_dir, report_file)
@@ -2335,21 +2464,12 @@ async def export_report_as_csv(report_type: str, date: str = None):
         converter = JSON2CSV()
         try:
             logger.info(f"Converting {json_path} to CSV format")
-            converter.convert_file(json_path, csv_path)
+            # The conversion is blocking file I/O + CPU work, keep it off the event loop
+            await asyncio.to_thread(converter.convert_file, json_path, csv_path)
             logger.info(f"Conversion successful, CSV file created at: {csv_path}")
 
-            # Read the CSV file
-            with open(csv_path, "r") as f:
-                csv_content = f.read()
-
-            # Return CSV as downloadable file
-            return Response(
-                content=csv_content,
-                media_type="text/csv",
-                headers={
-                    "Content-Disposition": f"attachment; filename={csv_filename}"
-                }
-            )
+            # Stream the CSV back as a downloadable file (sets Content-Disposition: attachment)
+            return FileResponse(csv_path, media_type="text/csv", filename=csv_filename)
 
         except Exception as e:
             logger.error(f"Error converting to CSV: {str(e)}")
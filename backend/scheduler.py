@@ -1,18 +1,24 @@
 import os
+import asyncio
 import logging
-import json
+import traceback
+import orjson
 from datetime import datetime, timedelta, time, date
 from pathlib import Path
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.jobstores.memory import MemoryJobStore
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, select
 from fastapi import APIRouter
 from .models import SessionLocal, ActivityLog
 # Only import functions that actually exist
-from .reports import generate_daily_report_for_date, generate_weekly_report as gen_weekly_report, DailyTimeBreakdown
+from .reports import (
+    generate_daily_report_for_date, generate_weekly_report as gen_weekly_report, aggregate_activity_buckets,
+    MonthlyReport, QuarterlyReport, AnnualReport, write_report_bytes
+)
+from .report_templates import generate_html_report
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -20,6 +26,16 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter()
 
+# Columns the report jobs read; selecting them returns plain Row tuples and
+# skips ORM instance hydration
+_LOG_COLS = (
+    ActivityLog.group,
+    ActivityLog.category,
+    ActivityLog.timestamp,
+    ActivityLog.duration_minutes,
+    ActivityLog.description
+)
+
 # Create report directories if they don't exist
 base_dir = os.path.dirname(os.path.abspath(__file__))
 REPORTS_BASE_DIR = os.path.join(base_dir, "..", "reports")
@@ -33,15 +49,26 @@ ANNUAL_REPORTS_DIR = os.path.join(REPORTS_BASE_DIR, "annual")
 for directory in [DAILY_REPORTS_DIR, WEEKLY_REPORTS_DIR, MONTHLY_REPORTS_DIR, 
                   QUARTERLY_REPORTS_DIR, ANNUAL_REPORTS_DIR]:
     os.makedirs(directory, exist_ok=True)
-    logger.info(f"Created report directory: {directory}")
+    logger.info("Created report directory: %s", directory)
 
-# Initialize the scheduler
-scheduler = BackgroundScheduler(
+# Maximum number of missing daily reports generated at once during backfills
+DAILY_BACKFILL_CONCURRENCY = 4
+
+# Report job schedules, staggered so the jobs don't start at the same minute
+DAILY_REPORT_TRIGGER = CronTrigger(hour=0, minute=5)
+WEEKLY_REPORT_TRIGGER = CronTrigger(day_of_week='mon', hour=0, minute=10)
+MONTHLY_REPORT_TRIGGER = CronTrigger(day=1, hour=0, minute=15)
+QUARTERLY_REPORT_TRIGGER = CronTrigger(month='1,4,7,10', day=1, hour=0, minute=20)
+ANNUAL_REPORT_TRIGGER = CronTrigger(month=1, day=1, hour=0, minute=25)
+
+# Initialize the scheduler. The report jobs are coroutines, so they run
+# directly on the application's event loop rather than in worker threads.
+scheduler = AsyncIOScheduler(
     jobstores={
         'default': MemoryJobStore()
     },
     executors={
-        'default': ThreadPoolExecutor(20)
+        'default': AsyncIOExecutor()
     },
     job_defaults={
         'coalesce': True,
@@ -57,36 +84,39 @@ async def generate_daily_report(target_date=None):
     Args:
         target_date (date, optional): The date to generate the report for. Defaults to yesterday.
     """
-    from models import SessionLocal, ActivityLog
-    from reports import generate_daily_report_for_date
-    
     if target_date is None:
         current_date = date.today()
         target_date = current_date - timedelta(days=1)
     
-    logger.info(f"Generating daily report for {target_date}")
+    logger.info("Generating daily report for %s", target_date)
     
     try:
-        # Get activity logs for the target date
-        db = SessionLocal()
+        # Get activity logs for the target date; the session is closed before
+        # the LLM call so it never stays open across the await
         start_date = datetime.combine(target_date, time.min)
-        end_date = datetime.combine(target_date, time.max)
+        end_date = datetime.combine(target_date + timedelta(days=1), time.min)
         
-        logs = db.query(ActivityLog).filter(
-            and_(
-                ActivityLog.timestamp >= start_date,
-                ActivityLog.timestamp < end_date
-            )
-        ).all()
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(*_LOG_COLS).where(
+                    and_(
+                        ActivityLog.timestamp >= start_date,
+                        ActivityLog.timestamp < end_date
+                    )
+                )
+            ).all()
+        finally:
+            db.close()
         
-        # Convert logs to the format expected by the report generator
+        # Convert rows to the format expected by the report generator
         logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
+            "group": group,
+            "category": category,
+            "timestamp": timestamp.isoformat(sep=' ', timespec='milliseconds'),
+            "duration_minutes": duration_minutes,
+            "description": description
+        } for group, category, timestamp, duration_minutes, description in rows]
         
         # Generate the report
         if logs_data:
@@ -95,23 +125,57 @@ async def generate_daily_report(target_date=None):
             # Save the report
             report_filename = os.path.join(
                 DAILY_REPORTS_DIR, 
-                f"daily_report_{target_date.strftime('%Y-%m-%d')}.json"
+                f"daily_report_{target_date.isoformat()}.json"
             )
             
-            with open(report_filename, "w") as f:
-                f.write(json.dumps(report_data, indent=2))
+            await asyncio.to_thread(
+                write_report_bytes, report_filename, orjson.dumps(report_data, option=orjson.OPT_NON_STR_KEYS)
+            )
                 
-            logger.info(f"Daily report saved to {report_filename}")
+            logger.info("Daily report saved to %s", report_filename)
             return report_data
         else:
-            logger.info(f"No activity logs found for {target_date}, skipping report generation")
+            logger.info("No activity logs found for %s, skipping report generation", target_date)
             return None
     except Exception as e:
-        logger.error(f"Error generating daily report: {str(e)}")
+        logger.error("Error generating daily report: %s", e)
         return None
-    finally:
-        if 'db' in locals():
-            db.close()
+
+async def _ensure_daily_reports(start_date, end_date):
+    """
+    Generate any missing daily reports between start_date and end_date (inclusive).
+    
+    The daily reports directory is listed once up front instead of stat-ing
+    one file per day, and the missing days are generated concurrently. Each
+    daily report opens its own session: a Session must not be shared between
+    concurrent tasks, and none should stay open across the LLM calls.
+    """
+    with os.scandir(DAILY_REPORTS_DIR) as entries:
+        existing = {entry.name for entry in entries}
+    
+    missing_days = []
+    current_day = start_date
+    while current_day <= end_date:
+        if f"daily_report_{current_day.isoformat()}.json" not in existing:
+            missing_days.append(current_day)
+        # Move to the next day
+        current_day += timedelta(days=1)
+    
+    if not missing_days:
+        return
+    
+    logger.info("Daily reports missing for %s day(s), generating them now", len(missing_days))
+    # Each daily report may call the LLM, so cap how many run at once
+    semaphore = asyncio.Semaphore(DAILY_BACKFILL_CONCURRENCY)
+    
+    async def _generate(day):
+        async with semaphore:
+            return await generate_daily_report(day)
+    
+    results = await asyncio.gather(*(_generate(day) for day in missing_days), return_exceptions=True)
+    for day, result in zip(missing_days, results):
+        if isinstance(result, Exception):
+            logger.error("Error generating daily report for %s: %s", day, result)
 
 async def generate_weekly_report():
     """
@@ -121,54 +185,44 @@ async def generate_weekly_report():
     # Add detailed logging for debugging
     logger.info("Starting weekly report generation in scheduler.py")
     
+    db = None
     try:
         current_date = date.today()
-        logger.info(f"Current date: {current_date}")
+        logger.info("Current date: %s", current_date)
         # Calculate the start and end of the previous week (Monday to Sunday)
         days_since_monday = current_date.weekday()
-        logger.info(f"Days since Monday: {days_since_monday}")
+        logger.info("Days since Monday: %s", days_since_monday)
         end_date = current_date - timedelta(days=days_since_monday + 1)  # Last Sunday
         start_date = end_date - timedelta(days=6)  # Last Monday
-        logger.info(f"Week range: {start_date} to {end_date}")
+        logger.info("Week range: %s to %s", start_date, end_date)
         
         # First, ensure we have daily reports for each day in the week
-        current_day = start_date
-        while current_day <= end_date:
-            # Check if daily report exists for this day
-            daily_report_filename = os.path.join(
-                DAILY_REPORTS_DIR, 
-                f"daily_report_{current_day.strftime('%Y-%m-%d')}.json"
-            )
-            
-            if not os.path.exists(daily_report_filename):
-                logger.info(f"Daily report for {current_day} not found, generating it now")
-                # Generate the daily report for this day
-                await generate_daily_report(current_day)
-            
-            # Move to the next day
-            current_day += timedelta(days=1)
+        await _ensure_daily_reports(start_date, end_date)
         
-        logger.info(f"Generating weekly report for {start_date} to {end_date}")
-        # Get activity logs for the week
         db = SessionLocal()
+        
+        logger.info("Generating weekly report for %s to %s", start_date, end_date)
+        # Get activity logs for the week
         start_datetime = datetime.combine(start_date, time.min)
-        end_datetime = datetime.combine(end_date, time.max)
+        end_datetime = datetime.combine(end_date + timedelta(days=1), time.min)
         
-        logs = db.query(ActivityLog).filter(
-            and_(
-                ActivityLog.timestamp >= start_datetime,
-                ActivityLog.timestamp <= end_datetime
+        rows = db.execute(
+            select(*_LOG_COLS).where(
+                and_(
+                    ActivityLog.timestamp >= start_datetime,
+                    ActivityLog.timestamp < end_datetime
+                )
             )
         ).all()
         
-        # Convert logs to the format expected by the report generator
+        # Convert rows to the format expected by the report generator
         logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
+            "group": group,
+            "category": category,
+            "timestamp": timestamp.isoformat(sep=' ', timespec='milliseconds'),
+            "duration_minutes": duration_minutes,
+            "description": description
+        } for group, category, timestamp, duration_minutes, description in rows]
         
         # Generate the weekly report
         if logs_data:
@@ -178,24 +232,97 @@ async def generate_weekly_report():
             # Save the report
             report_filename = os.path.join(
                 WEEKLY_REPORTS_DIR, 
-                f"weekly_report_{start_date.strftime('%Y-%m-%d')}_to_{end_date.strftime('%Y-%m-%d')}.json"
+                f"weekly_report_{start_date.isoformat()}_to_{end_date.isoformat()}.json"
             )
             
-            with open(report_filename, "w") as f:
-                f.write(json.dumps(report_data, indent=2))
+            await asyncio.to_thread(
+                write_report_bytes, report_filename, orjson.dumps(report_data, option=orjson.OPT_NON_STR_KEYS)
+            )
                 
-            logger.info(f"Weekly report saved to {report_filename}")
+            logger.info("Weekly report saved to %s", report_filename)
         else:
-            logger.info(f"No activity logs found for week {start_date} to {end_date}, skipping report generation")
+            logger.info("No activity logs found for week %s to %s, skipping report generation", start_date, end_date)
     
     except Exception as e:
-        import traceback
         error_stack = traceback.format_exc()
-        logger.error(f"Error generating weekly report: {str(e)}\n{error_stack}")
+        logger.error("Error generating weekly report: %s\n%s", e, error_stack)
     finally:
-        if 'db' in locals():
+        if db is not None:
             db.close()
 
+async def _generate_period_report(start_date, end_date, report_dir, filename, report_cls, period_label):
+    """
+    Generate and save an HTML-only periodic report (monthly, quarterly, annual).
+    
+    Args:
+        start_date (date): First day of the period.
+        end_date (date): Last day of the period (inclusive).
+        report_dir (str): Directory the report JSON is written to.
+        filename (str): Name of the report JSON file.
+        report_cls: Pydantic report model wrapping the HTML (e.g. MonthlyReport).
+        period_label (str): Human readable period name used in log messages.
+    """
+    db = SessionLocal()
+    try:
+        start_datetime = datetime.combine(start_date, time.min)
+        end_datetime = datetime.combine(end_date + timedelta(days=1), time.min)
+        
+        # Aggregate per day/group/category in SQL first; an empty period is
+        # detected here without fetching or converting any activity rows
+        total_time, time_by_group, time_by_category, daily_breakdown = aggregate_activity_buckets(
+            db, start_datetime, end_datetime
+        )
+        
+        if not daily_breakdown:
+            logger.info("No activity logs found for %s, skipping report generation", period_label)
+            return None
+        
+        logger.info("Generating report for %s with HTML content", period_label)
+        
+        # The HTML report lists every activity, so the rows are still needed;
+        # stream them from the result instead of materializing a Row list first
+        result = db.execute(
+            select(*_LOG_COLS).where(
+                and_(
+                    ActivityLog.timestamp >= start_datetime,
+                    ActivityLog.timestamp < end_datetime
+                )
+            )
+        )
+        logs_data = [{
+            "group": group,
+            "category": category,
+            "timestamp": timestamp.isoformat(sep=' ', timespec='milliseconds'),
+            "duration_minutes": duration_minutes,
+            "description": description
+        } for group, category, timestamp, duration_minutes, description in result]
+        
+        # Create visualizations dictionary
+        visualizations = {}
+        
+        # Generate HTML report with embedded charts
+        html_report = generate_html_report(start_date, end_date, 
+                                         total_time, time_by_group, time_by_category, 
+                                         daily_breakdown, visualizations, logs_data)
+        
+        # Create the report with HTML only and convert it for JSON serialization
+        report_data = report_cls(html_report=html_report).model_dump()
+        
+        # Save the report
+        report_filename = os.path.join(report_dir, filename)
+        await asyncio.to_thread(
+            write_report_bytes, report_filename, orjson.dumps(report_data, option=orjson.OPT_NON_STR_KEYS)
+        )
+            
+        logger.info("Report for %s saved to %s", period_label, report_filename)
+        return report_data
+    
+    except Exception as e:
+        logger.error("Error generating report for %s: %s", period_label, e)
+        return None
+    finally:
+        db.close()
+
 async def generate_monthly_report():
     """
     Generate a monthly report for the previous month.
@@ -212,134 +339,19 @@ async def generate_monthly_report():
     # Calculate the first day of the previous month
     first_day_previous_month = date(last_day_previous_month.year, last_day_previous_month.month, 1)
     
-    logger.info(f"Generating monthly report for {first_day_previous_month} to {last_day_previous_month}")
+    logger.info("Generating monthly report for %s to %s", first_day_previous_month, last_day_previous_month)
     
-    # First, ensure we have daily reports for each day in the month
-    current_day = first_day_previous_month
-    while current_day <= last_day_previous_month:
-        # Check if daily report exists for this day
-        daily_report_filename = os.path.join(
-            DAILY_REPORTS_DIR, 
-            f"daily_report_{current_day.strftime('%Y-%m-%d')}.json"
-        )
-        
-        if not os.path.exists(daily_report_filename):
-            logger.info(f"Daily report for {current_day} not found, generating it now")
-            # Generate the daily report for this day
-            await generate_daily_report(current_day)
-        
-        # Move to the next day
-        current_day += timedelta(days=1)
+    month_name = first_day_previous_month.strftime("%B")
+    year = first_day_previous_month.year
     
-    try:
-        # Get activity logs for the month
-        db = SessionLocal()
-        start_datetime = datetime.combine(first_day_previous_month, time.min)
-        end_datetime = datetime.combine(last_day_previous_month, time.max)
-        
-        logs = db.query(ActivityLog).filter(
-            and_(
-                ActivityLog.timestamp >= start_datetime,
-                ActivityLog.timestamp <= end_datetime
-            )
-        ).all()
-        
-        # Convert logs to the format expected by the report generator
-        logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
-        
-        # Generate the monthly report
-        if logs_data:
-            logger.info("Generating monthly report with HTML content")
-            
-            # Calculate total time
-            total_time = sum(log["duration_minutes"] for log in logs_data)
-            
-            # Calculate time by group and category
-            time_by_group = {}
-            time_by_category = {}
-            daily_breakdown = {}
-            
-            # Process logs to get time breakdowns
-            for log in logs_data:
-                # Group breakdown
-                group = log["group"]
-                if group not in time_by_group:
-                    time_by_group[group] = 0
-                time_by_group[group] += log["duration_minutes"]
-                
-                # Category breakdown
-                category = log["category"]
-                if category not in time_by_category:
-                    time_by_category[category] = {}
-                if group not in time_by_category[category]:
-                    time_by_category[category][group] = 0
-                time_by_category[category][group] += log["duration_minutes"]
-                
-                # Daily breakdown
-                log_date = datetime.strptime(log["timestamp"].split()[0], "%Y-%m-%d").date()
-                day_str = log_date.strftime("%Y-%m-%d")
-                
-                if day_str not in daily_breakdown:
-                    daily_breakdown[day_str] = DailyTimeBreakdown(
-                        date=day_str,
-                        total_minutes=0,
-                        time_by_group={},
-                        time_by_category={}
-                    )
-                
-                daily_breakdown[day_str].total_minutes += log["duration_minutes"]
-                
-                if group not in daily_breakdown[day_str].time_by_group:
-                    daily_breakdown[day_str].time_by_group[group] = 0
-                daily_breakdown[day_str].time_by_group[group] += log["duration_minutes"]
-                
-                if category not in daily_breakdown[day_str].time_by_category:
-                    daily_breakdown[day_str].time_by_category[category] = 0
-                daily_breakdown[day_str].time_by_category[category] += log["duration_minutes"]
-            
-            # Create visualizations dictionary
-            visualizations = {}
-            
-            # Generate HTML report with embedded charts
-            from report_templates import generate_html_report
-            html_report = generate_html_report(first_day_previous_month, last_day_previous_month, 
-                                             total_time, time_by_group, time_by_category, 
-                                             daily_breakdown, visualizations, logs_data)
-            
-            # Create the monthly report with HTML only
-            from reports import MonthlyReport
-            monthly_report = MonthlyReport(
-                html_report=html_report
-            )
-            
-            # Convert to dictionary for JSON serialization
-            report_data = monthly_report.model_dump()
-            
-            # Save the report
-            month_name = first_day_previous_month.strftime("%B")
-            year = first_day_previous_month.year
-            report_filename = os.path.join(
-                MONTHLY_REPORTS_DIR, 
-                f"monthly_report_{year}_{month_name}.json"
-            )
-            
-            with open(report_filename, "w") as f:
-                f.write(json.dumps(report_data, indent=2))
-                
-            logger.info(f"Monthly report saved to {report_filename}")
-        else:
-            logger.info(f"No activity logs found for month {first_day_previous_month} to {last_day_previous_month}, skipping report generation")
+    # First, ensure we have daily reports for each day in the month
+    await _ensure_daily_reports(first_day_previous_month, last_day_previous_month)
     
-    except Exception as e:
-        logger.error(f"Error generating monthly report: {str(e)}")
-    finally:
-        db.close()
+    return await _generate_period_report(
+        first_day_previous_month, last_day_previous_month,
+        MONTHLY_REPORTS_DIR, f"monthly_report_{year}_{month_name}.json",
+        MonthlyReport, f"month {first_day_previous_month} to {last_day_previous_month}"
+    )
 
 async def generate_quarterly_report():
     """
@@ -373,115 +385,13 @@ async def generate_quarterly_report():
         next_month_date = date(year, end_month + 1, 1)
         end_date = next_month_date - timedelta(days=1)
     
-    logger.info(f"Generating quarterly report for Q{previous_quarter} {year} ({start_date} to {end_date})")
+    logger.info("Generating quarterly report for Q%s %s (%s to %s)", previous_quarter, year, start_date, end_date)
     
-    try:
-        # Get activity logs for the quarter
-        db = SessionLocal()
-        start_datetime = datetime.combine(start_date, time.min)
-        end_datetime = datetime.combine(end_date, time.max)
-        
-        logs = db.query(ActivityLog).filter(
-            and_(
-                ActivityLog.timestamp >= start_datetime,
-                ActivityLog.timestamp <= end_datetime
-            )
-        ).all()
-        
-        # Convert logs to the format expected by the report generator
-        logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
-        
-        # Generate the quarterly report
-        if logs_data:
-            logger.info("Generating quarterly report with HTML content")
-            
-            # Calculate total time
-            total_time = sum(log["duration_minutes"] for log in logs_data)
-            
-            # Calculate time by group and category
-            time_by_group = {}
-            time_by_category = {}
-            daily_breakdown = {}
-            
-            # Process logs to get time breakdowns
-            for log in logs_data:
-                # Group breakdown
-                group = log["group"]
-                if group not in time_by_group:
-                    time_by_group[group] = 0
-                time_by_group[group] += log["duration_minutes"]
-                
-                # Category breakdown
-                category = log["category"]
-                if category not in time_by_category:
-                    time_by_category[category] = {}
-                if group not in time_by_category[category]:
-                    time_by_category[category][group] = 0
-                time_by_category[category][group] += log["duration_minutes"]
-                
-                # Daily breakdown
-                log_date = datetime.strptime(log["timestamp"].split()[0], "%Y-%m-%d").date()
-                day_str = log_date.strftime("%Y-%m-%d")
-                
-                if day_str not in daily_breakdown:
-                    daily_breakdown[day_str] = DailyTimeBreakdown(
-                        date=day_str,
-                        total_minutes=0,
-                        time_by_group={},
-                        time_by_category={}
-                    )
-                
-                daily_breakdown[day_str].total_minutes += log["duration_minutes"]
-                
-                if group not in daily_breakdown[day_str].time_by_group:
-                    daily_breakdown[day_str].time_by_group[group] = 0
-                daily_breakdown[day_str].time_by_group[group] += log["duration_minutes"]
-                
-                if category not in daily_breakdown[day_str].time_by_category:
-                    daily_breakdown[day_str].time_by_category[category] = 0
-                daily_breakdown[day_str].time_by_category[category] += log["duration_minutes"]
-            
-            # Create visualizations dictionary
-            visualizations = {}
-            
-            # Generate HTML report with embedded charts
-            from report_templates import generate_html_report
-            html_report = generate_html_report(start_date, end_date, 
-                                             total_time, time_by_group, time_by_category, 
-                                             daily_breakdown, visualizations, logs_data)
-            
-            # Create the quarterly report with HTML only
-            from reports import QuarterlyReport
-            quarterly_report = QuarterlyReport(
-                html_report=html_report
-            )
-            
-            # Convert to dictionary for JSON serialization
-            report_data = quarterly_report.model_dump()
-            
-            # Save the report
-            report_filename = os.path.join(
-                QUARTERLY_REPORTS_DIR, 
-                f"quarterly_report_Q{previous_quarter}_{year}.json"
-            )
-            
-            with open(report_filename, "w") as f:
-                f.write(json.dumps(report_data, indent=2))
-                
-            logger.info(f"Quarterly report saved to {report_filename}")
-        else:
-            logger.info(f"No activity logs found for quarter Q{previous_quarter} {year}, skipping report generation")
-    
-    except Exception as e:
-        logger.error(f"Error generating quarterly report: {str(e)}")
-    finally:
-        db.close()
+    return await _generate_period_report(
+        start_date, end_date,
+        QUARTERLY_REPORTS_DIR, f"quarterly_report_Q{previous_quarter}_{year}.json",
+        QuarterlyReport, f"quarter Q{previous_quarter} {year}"
+    )
 
 async def generate_annual_report():
     """
@@ -498,122 +408,19 @@ async def generate_annual_report():
     start_date = date(previous_year, 1, 1)
     end_date = date(previous_year, 12, 31)
     
-    logger.info(f"Generating annual report for {previous_year} ({start_date} to {end_date})")
-    
-    try:
-        # Get activity logs for the year
-        db = SessionLocal()
-        start_datetime = datetime.combine(start_date, time.min)
-        end_datetime = datetime.combine(end_date, time.max)
-        
-        logs = db.query(ActivityLog).filter(
-            and_(
-                ActivityLog.timestamp >= start_datetime,
-                ActivityLog.timestamp <= end_datetime
-            )
-        ).all()
-        
-        # Convert logs to the format expected by the report generator
-        logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
-        
-        # Generate the annual report
-        if logs_data:
-            logger.info("Generating annual report with HTML content")
-            
-            # Calculate total time
-            total_time = sum(log["duration_minutes"] for log in logs_data)
-            
-            # Calculate time by group and category
-            time_by_group = {}
-            time_by_category = {}
-            daily_breakdown = {}
-            
-            # Process logs to get time breakdowns
-            for log in logs_data:
-                # Group breakdown
-                group = log["group"]
-                if group not in time_by_group:
-                    time_by_group[group] = 0
-                time_by_group[group] += log["duration_minutes"]
-                
-                # Category breakdown
-                category = log["category"]
-                if category not in time_by_category:
-                    time_by_category[category] = {}
-                if group not in time_by_category[category]:
-                    time_by_category[category][group] = 0
-                time_by_category[category][group] += log["duration_minutes"]
-                
-                # Daily breakdown
-                log_date = datetime.strptime(log["timestamp"].split()[0], "%Y-%m-%d").date()
-                day_str = log_date.strftime("%Y-%m-%d")
-                
-                if day_str not in daily_breakdown:
-                    daily_breakdown[day_str] = DailyTimeBreakdown(
-                        date=day_str,
-                        total_minutes=0,
-                        time_by_group={},
-                        time_by_category={}
-                    )
-                
-                daily_breakdown[day_str].total_minutes += log["duration_minutes"]
-                
-                if group not in daily_breakdown[day_str].time_by_group:
-                    daily_breakdown[day_str].time_by_group[group] = 0
-                daily_breakdown[day_str].time_by_group[group] += log["duration_minutes"]
-                
-                if category not in daily_breakdown[day_str].time_by_category:
-                    daily_breakdown[day_str].time_by_category[category] = 0
-                daily_breakdown[day_str].time_by_category[category] += log["duration_minutes"]
-            
-            # Create visualizations dictionary
-            visualizations = {}
-            
-            # Generate HTML report with embedded charts
-            from report_templates import generate_html_report
-            html_report = generate_html_report(start_date, end_date, 
-                                             total_time, time_by_group, time_by_category, 
-                                             daily_breakdown, visualizations, logs_data)
-            
-            # Create the annual report with HTML only
-            from reports import AnnualReport
-            annual_report = AnnualReport(
-                html_report=html_report
-            )
-            
-            # Convert to dictionary for JSON serialization
-            report_data = annual_report.model_dump()
-            
-            # Save the report
-            report_filename = os.path.join(
-                ANNUAL_REPORTS_DIR, 
-                f"annual_report_{previous_year}.json"
-            )
-            
-            with open(report_filename, "w") as f:
-                f.write(json.dumps(report_data, indent=2))
-                
-            logger.info(f"Annual report saved to {report_filename}")
-        else:
-            logger.info(f"No activity logs found for year {previous_year}, skipping report generation")
+    logger.info("Generating annual report for %s (%s to %s)", previous_year, start_date, end_date)
     
-    except Exception as e:
-        logger.error(f"Error generating annual report: {str(e)}")
-    finally:
-        db.close()
+    return await _generate_period_report(
+        start_date, end_date,
+        ANNUAL_REPORTS_DIR, f"annual_report_{previous_year}.json",
+        AnnualReport, f"year {previous_year}"
+    )
 
 def start_scheduler():
     """
-    Start the background scheduler with all the scheduled jobs.
+    Start the scheduler with all the scheduled jobs.
+    Must be called from within the running event loop (e.g. an application startup hook).
     """
-    import json  # Import here to avoid circular imports
-    
     if scheduler.running:
         logger.warning("Scheduler is already running")
         return
@@ -621,7 +428,7 @@ def start_scheduler():
     # Schedule daily reports to run at 00:05 every day
     scheduler.add_job(
         generate_daily_report,
-        CronTrigger(hour=0, minute=5),
+        DAILY_REPORT_TRIGGER,
         id='daily_report',
         name='Generate Daily Report',
         replace_existing=True
@@ -630,7 +437,7 @@ def start_scheduler():
     # Schedule weekly reports to run at 00:10 every Monday
     scheduler.add_job(
         generate_weekly_report,
-        CronTrigger(day_of_week='mon', hour=0, minute=10),
+        WEEKLY_REPORT_TRIGGER,
         id='weekly_report',
         name='Generate Weekly Report',
         replace_existing=True
@@ -639,7 +446,7 @@ def start_scheduler():
     # Schedule monthly reports to run at 00:15 on the 1st day of each month
     scheduler.add_job(
         generate_monthly_report,
-        CronTrigger(day=1, hour=0, minute=15),
+        MONTHLY_REPORT_TRIGGER,
         id='monthly_report',
         name='Generate Monthly Report',
         replace_existing=True
@@ -648,7 +455,7 @@ def start_scheduler():
     # Schedule quarterly reports to run at 00:20 on the 1st day of January, April, July, and October
     scheduler.add_job(
         generate_quarterly_report,
-        CronTrigger(month='1,4,7,10', day=1, hour=0, minute=20),
+        QUARTERLY_REPORT_TRIGGER,
         id='quarterly_report',
         name='Generate Quarterly Report',
         replace_existing=True
@@ -657,7 +464,7 @@ def start_scheduler():
     # Schedule annual reports to run at 00:25 on January 1st
     scheduler.add_job(
         generate_annual_report,
-        CronTrigger(month=1, day=1, hour=0, minute=25),
+        ANNUAL_REPORT_TRIGGER,
         id='annual_report',
         name='Generate Annual Report',
         replace_existing=True
@@ -669,7 +476,7 @@ def start_scheduler():
 
 def stop_scheduler():
     """
-    Stop the background scheduler.
+    Stop the scheduler.
     """
     if not scheduler.running:
         logger.warning("Scheduler is not running")
@@ -717,11 +524,15 @@ async def trigger_report(report_type: str):
         
         return {"success": True, "message": f"{report_type.capitalize()} report generation triggered successfully"}
     except Exception as e:
-        import traceback
         error_stack = traceback.format_exc()
-        logger.error(f"Error triggering {report_type} report: {str(e)}\n{error_stack}")
+        logger.error("Error triggering %s report: %s\n%s", report_type, e, error_stack)
         return {"success": False, "error": str(e), "traceback": error_stack}
 
 # For testing purposes, you can run this file directly
 if __name__ == "__main__":
-    start_scheduler()
+    async def _run_scheduler():
+        start_scheduler()
+        # Keep the event loop alive so the scheduled jobs can fire
+        await asyncio.Event().wait()
+
+    asyncio.run(_run_scheduler())
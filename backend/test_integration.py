@@ -7,7 +7,7 @@ from activitylogger.backend.reports import generate_activity_report
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_report_generation():
     """Test complete report generation flow"""
     test_activities = [
@@ -1,79 +1,161 @@
 import asyncio
+import hashlib
 import json
 import logging
+import os
+import re
+import tempfile
 import httpx
-from models import SessionLocal, Settings
+import orjson
+from models import get_settings
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared client so repeated calls reuse pooled keep-alive connections to LMStudio.
+# Created lazily inside the running event loop rather than at import time.
+_LLM_CLIENT = None
+_LLM_CLIENT_LOCK = asyncio.Lock()
+LLM_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+
+# Error bodies (e.g. an HTML page when no model is loaded) are truncated to this many bytes
+LLM_ERROR_BODY_LIMIT = 512
+
+async def get_llm_client() -> httpx.AsyncClient:
+    """Return the shared LLM client, creating it on first use"""
+    global _LLM_CLIENT
+    async with _LLM_CLIENT_LOCK:
+        if _LLM_CLIENT is None or _LLM_CLIENT.is_closed:
+            # Increase timeout to 120 seconds
+            _LLM_CLIENT = httpx.AsyncClient(timeout=120.0, limits=LLM_CLIENT_LIMITS)
+        return _LLM_CLIENT
+
+async def close_llm_client():
+    """Close the shared LLM client and its pooled connections"""
+    global _LLM_CLIENT
+    if _LLM_CLIENT is not None:
+        await _LLM_CLIENT.aclose()
+        _LLM_CLIENT = None
+
+# Optional response cache for repeated runs of the same deterministic prompt.
+# Enabled with LLM_CACHE=1; leave it unset to always hit LMStudio.
+LLM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "activitylogger", "llm")
+_MEM_CACHE: dict[str, str] = {}
+
+def llm_cache_enabled() -> bool:
+    return os.environ.get("LLM_CACHE") == "1"
+
+def llm_cache_key(model: str, temperature: float, system: str, user: str) -> str:
+    """Content-addressed key for a prompt and the settings that affect its answer"""
+    return hashlib.blake2b(f"{model}|{temperature}|{system}|{user}".encode(), digest_size=16).hexdigest()
+
+def load_cached_response(key: str):
+    """Return a cached response from memory or disk, or None on a miss"""
+    if key in _MEM_CACHE:
+        return _MEM_CACHE[key]
+    path = os.path.join(LLM_CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, "r") as f:
+            content = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    _MEM_CACHE[key] = content
+    return content
+
+def store_cached_response(key: str, content: str):
+    """Remember a response in memory and write it to disk atomically"""
+    _MEM_CACHE[key] = content
+    os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+    path = os.path.join(LLM_CACHE_DIR, f"{key}.json")
+    # A uniquely named temp file, so concurrent misses for one key never share it
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=LLM_CACHE_DIR, prefix=f"{key}.",
+                                     suffix=".tmp", delete=False) as f:
+        tmp_path = f.name
+        try:
+            json.dump(content, f)
+        except BaseException:
+            f.close()
+            os.unlink(tmp_path)
+            raise
+    os.replace(tmp_path, path)
+
 async def call_llm_api(prompt: str):
     """Direct LLM API call for testing"""
-    db = SessionLocal()
+    settings = get_settings()
+    if not settings:
+        raise ValueError("Settings not configured")
+
+    system_prompt = "You are a professional activity report analyzer."
+    temperature = 0.7
+
+    cache_key = None
+    if llm_cache_enabled():
+        cache_key = llm_cache_key(settings.lmstudioModel, temperature, system_prompt, prompt)
+        cached = load_cached_response(cache_key)
+        if cached is not None:
+            logger.info("Using cached LLM response")
+            return cached
+
+    url = f"{settings.lmstudioEndpoint}/chat/completions"
+    headers = {"Content-Type": "application/json"}
+    payload = {
+        "model": settings.lmstudioModel,
+        "messages": [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        "stream": False,
+        "temperature": temperature,
+        "max_tokens": 2000
+    }
+
+    logger.info(f"Calling LMStudio at: {url} with model: {settings.lmstudioModel}")
+    client = await get_llm_client()
     try:
-        settings = db.query(Settings).first()
-        if not settings:
-            raise ValueError("Settings not configured")
-            
-        url = f"{settings.lmstudioEndpoint}/chat/completions"
-        headers = {"Content-Type": "application/json"}
-        payload = {
-            "model": settings.lmstudioModel,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a professional activity report analyzer."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "stream": False,
-            "temperature": 0.7,
-            "max_tokens": 2000
-        }
-        
-        logger.info(f"Calling LMStudio at: {url} with model: {settings.lmstudioModel}")
-        # Increase timeout to 120 seconds
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-                if response.status_code != 200:
-                    raise ValueError(f"LLM API error: {response.text}")
-                
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                logger.info("LLM response received successfully")
-                return content
-                
-            except httpx.ReadTimeout:
-                logger.error("LMStudio API timeout - try loading the model first in LMStudio UI")
-                raise ValueError("LMStudio API timeout - ensure model is loaded and ready")
-            except httpx.ConnectError:
-                logger.error("Could not connect to LMStudio - check if it's running")
-                raise ValueError("Could not connect to LMStudio - ensure it's running")
-    finally:
-        db.close()
+        response = await client.post(url, json=payload, headers=headers)
+        if response.status_code != 200:
+            body = response.content[:LLM_ERROR_BODY_LIMIT].decode("utf-8", "replace")
+            raise ValueError(f"LLM API error {response.status_code}: {body}")
+
+        # Parse the raw body bytes directly instead of going through response.json()
+        result = orjson.loads(response.content)
+        content = result['choices'][0]['message']['content']
+        logger.info("LLM response received successfully")
+        if cache_key is not None:
+            store_cached_response(cache_key, content)
+        return content
+
+    except httpx.TimeoutException:
+        logger.error("LMStudio API timeout - try loading the model first in LMStudio UI")
+        raise ValueError("LMStudio API timeout - ensure model is loaded and ready")
+    except httpx.ConnectError:
+        logger.error("Could not connect to LMStudio - check if it's running")
+        raise ValueError("Could not connect to LMStudio - ensure it's running")
 
 # ...existing imports and logging setup...
 
+# A response opening with a markdown code fence (any language tag): the body
+# runs to the last closing fence, so trailing prose after it is dropped
+_FENCE_RE = re.compile(r'\A\s*```[^\n]*\n(.*)```', re.S)
+_FENCE_MATCH = _FENCE_RE.match
+_LOADS = orjson.loads
+
 def extract_json_from_response(response: str) -> dict:
     """Extract JSON from a response that might be wrapped in markdown code blocks"""
     # Remove markdown code block markers if present
-    if response.startswith('```'):
-        # Find the end of the first line and start after it
-        first_newline = response.find('\n')
-        if first_newline != -1:
-            # Find the last ``` and exclude it
-            last_marker = response.rfind('```')
-            if last_marker != -1:
-                response = response[first_newline + 1:last_marker].strip()
+    match = _FENCE_MATCH(response)
+    response = match.group(1).strip() if match else response.strip()
     
     try:
-        return json.loads(response)
-    except json.JSONDecodeError as e:
+        return _LOADS(response)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON: {e}")
         logger.debug(f"Attempted to parse: {response}")
         raise
@@ -125,6 +207,7 @@ async def test_llm_connection():
         logger.error(f"Test failed: {str(e)}", exc_info=True)
         success = False
     finally:
+        await close_llm_client()
         if success:
             logger.info("✅ Test completed successfully!")
             logger.info("JSON structure is valid and complete")
@@ -0,0 +1,96 @@
+import pytest
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from activitylogger.backend import scheduler
+from activitylogger.backend.models import ActivityLog
+from activitylogger.backend.reports import MonthlyReport
+
+# Two activities sit exactly on the period boundaries, two just outside them
+PERIOD_START = date(2032, 2, 1)
+PERIOD_END = date(2032, 2, 29)
+SEEDED_LOGS = [
+    (datetime(2032, 1, 31, 23, 59, 59), "Work", "Coding", 200),
+    (datetime(2032, 2, 1, 0, 0, 0), "Work", "Coding", 30),
+    (datetime(2032, 2, 15, 12, 0, 0), "Work", "Meetings", 45),
+    (datetime(2032, 2, 29, 23, 59, 59, 999000), "Personal", "Reading", 15),
+    (datetime(2032, 3, 1, 0, 0, 0), "Work", "Coding", 100),
+]
+
+@pytest.fixture
+def period_report(db, monkeypatch, tmp_path):
+    """Seed the test database and capture what the period report renders."""
+    for timestamp, category, group, minutes in SEEDED_LOGS:
+        db.add(ActivityLog(
+            timestamp=timestamp,
+            category=category,
+            group=group,
+            duration_minutes=minutes,
+            description=f"{group} activity"
+        ))
+    db.flush()
+
+    # The report opens its own sessions; bind them to the test transaction
+    monkeypatch.setattr(scheduler, "SessionLocal", lambda: Session(bind=db.connection()))
+
+    rendered = []
+    def fake_generate_html_report(*args):
+        rendered.append(args)
+        return "<html></html>"
+    monkeypatch.setattr(scheduler, "generate_html_report", fake_generate_html_report)
+
+    async def generate(start_date, end_date):
+        return await scheduler._generate_period_report(
+            start_date, end_date, str(tmp_path), "period_report.json", MonthlyReport, "test period"
+        )
+    return generate, rendered, tmp_path
+
+def per_row_totals(start_date, end_date):
+    """Totals computed row by row, as the report did before aggregating in SQL."""
+    total_time = 0
+    time_by_group = {}
+    time_by_category = {}
+    daily_breakdown = {}
+    for timestamp, category, group, minutes in SEEDED_LOGS:
+        if not start_date <= timestamp.date() <= end_date:
+            continue
+        total_time += minutes
+        time_by_group[group] = time_by_group.get(group, 0) + minutes
+        time_by_category[category] = time_by_category.get(category, 0) + minutes
+        day = daily_breakdown.setdefault(
+            timestamp.strftime("%Y-%m-%d"),
+            {"total_time": 0, "time_by_group": {}, "time_by_category": {}}
+        )
+        day["total_time"] += minutes
+        day["time_by_group"][group] = day["time_by_group"].get(group, 0) + minutes
+        day["time_by_category"][category] = day["time_by_category"].get(category, 0) + minutes
+    return total_time, time_by_group, time_by_category, daily_breakdown
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_period_report_matches_per_row_totals(period_report):
+    """The SQL aggregation keeps both boundary days and matches the per-row totals."""
+    generate, rendered, report_dir = period_report
+
+    report = await generate(PERIOD_START, PERIOD_END)
+
+    assert report is not None, "A period with activities should produce a report"
+    assert (report_dir / "period_report.json").exists()
+    assert len(rendered) == 1
+    _, _, total_time, time_by_group, time_by_category, daily_breakdown, _, logs_data = rendered[0]
+
+    expected_total, expected_groups, expected_categories, expected_days = per_row_totals(PERIOD_START, PERIOD_END)
+    assert total_time == expected_total == 90
+    assert time_by_group == expected_groups
+    assert time_by_category == expected_categories
+    assert {day: breakdown.model_dump() for day, breakdown in daily_breakdown.items()} == expected_days
+    assert len(logs_data) == 3, "Only the activities inside the half-open range are listed"
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_period_report_skips_empty_period(period_report):
+    """A period without activities returns None and writes nothing."""
+    generate, rendered, report_dir = period_report
+
+    report = await generate(date(2033, 6, 1), date(2033, 6, 30))
+
+    assert report is None
+    assert rendered == []
+    assert not (report_dir / "period_report.json").exists()
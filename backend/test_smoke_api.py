@@ -1,6 +1,8 @@
+import asyncio
 import pytest
 from datetime import datetime
 from fastapi.testclient import TestClient
+from activitylogger.backend.reports import aggregate_activity_buckets, annual_fingerprint, load_annual_buckets
 # The client fixture will be injected from conftest.py, so we don't need to import app here directly
 # from activitylogger.backend.main import app 
 
@@ -23,48 +25,12 @@ def test_read_settings_api(client): # Added client fixture
     except ValueError:
         pytest.fail("Response was not valid JSON.")
 
-def test_list_daily_reports_api(client): # Added client fixture
-    """Test if the /api/reports/list-reports/daily endpoint is reachable and returns JSON."""
-    response = client.get("/api/reports/list-reports/daily")
-    assert response.status_code == 200
-    assert "application/json" in response.headers["content-type"]
-    try:
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "reports" in data
-        assert isinstance(data["reports"], list)
-    except ValueError:
-        pytest.fail("Response was not valid JSON.")
-
-def test_list_weekly_reports_api(client): # Added client fixture
-    """Test if the /api/reports/list-reports/weekly endpoint is reachable and returns JSON."""
-    response = client.get("/api/reports/list-reports/weekly")
-    assert response.status_code == 200
-    assert "application/json" in response.headers["content-type"]
-    try:
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "reports" in data
-        assert isinstance(data["reports"], list)
-    except ValueError:
-        pytest.fail("Response was not valid JSON.")
-
-def test_list_monthly_reports_api(client): # Added client fixture
-    """Test if the /api/reports/list-reports/monthly endpoint is reachable and returns JSON."""
-    response = client.get("/api/reports/list-reports/monthly")
-    assert response.status_code == 200
-    assert "application/json" in response.headers["content-type"]
-    try:
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "reports" in data
-        assert isinstance(data["reports"], list)
-    except ValueError:
-        pytest.fail("Response was not valid JSON.")
+REPORT_PERIODS = ["daily", "weekly", "monthly", "quarterly", "annual"]
 
-def test_list_quarterly_reports_api(client): # Added client fixture
-    """Test if the /api/reports/list-reports/quarterly endpoint is reachable and returns JSON."""
-    response = client.get("/api/reports/list-reports/quarterly")
+@pytest.mark.parametrize("period", REPORT_PERIODS)
+def test_list_reports_api(client, period):
+    """Test if the /api/reports/list-reports/{period} endpoint is reachable and returns JSON."""
+    response = client.get(f"/api/reports/list-reports/{period}")
     assert response.status_code == 200
     assert "application/json" in response.headers["content-type"]
     try:
@@ -75,18 +41,16 @@ def test_list_quarterly_reports_api(client): # Added client fixture
     except ValueError:
         pytest.fail("Response was not valid JSON.")
 
-def test_list_annual_reports_api(client): # Added client fixture
-    """Test if the /api/reports/list-reports/annual endpoint is reachable and returns JSON."""
-    response = client.get("/api/reports/list-reports/annual")
-    assert response.status_code == 200
-    assert "application/json" in response.headers["content-type"]
-    try:
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "reports" in data
-        assert isinstance(data["reports"], list)
-    except ValueError:
-        pytest.fail("Response was not valid JSON.")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_reports_concurrently(client, async_client):
+    """Listings fetched concurrently match the ones served one at a time."""
+    sequential = {period: client.get(f"/api/reports/list-reports/{period}").json() for period in REPORT_PERIODS}
+    responses = await asyncio.gather(
+        *(async_client.get(f"/api/reports/list-reports/{period}") for period in REPORT_PERIODS)
+    )
+    for period, response in zip(REPORT_PERIODS, responses):
+        assert response.status_code == 200, f"{period}: expected 200, got {response.status_code}"
+        assert response.json() == sequential[period], f"{period}: concurrent listing differs from the sequential one"
 
 def test_update_and_read_settings_api(client): # Added client fixture
     """Test updating settings and reading them back."""
@@ -108,31 +72,18 @@ def test_update_and_read_settings_api(client): # Added client fixture
         else:
             updated_categories[0]["groups"][0] = updated_categories[0]["groups"][0] + " Updated"
 
+    # GET returns every settings field, so only the changed ones need overriding
     settings_to_update = {
+        **initial_settings,
         "notificationInterval": updated_notification_interval,
-        "audioDevice": initial_settings.get("audioDevice", "default_device"),
-        "llmProvider": initial_settings.get("llmProvider", "default_provider"),
-        "openRouterApiKey": initial_settings.get("openRouterApiKey", ""),
-        "openRouterLLM": initial_settings.get("openRouterLLM", ""),
-        "lmstudioEndpoint": initial_settings.get("lmstudioEndpoint", "http://localhost:1234/v1"),
-        "lmstudioModel": initial_settings.get("lmstudioModel", "default_model"),
-        "lmstudioLogsModel": initial_settings.get("lmstudioLogsModel"),
-        "lmstudioReportsModel": initial_settings.get("lmstudioReportsModel"),
         "categories": updated_categories
     }
 
-    # 2. Update settings
+    # 2. Update settings; the PUT response is the persisted settings record
+    # (same shape as GET /api/settings), so no extra read-back is needed
     response_update = client.put("/api/settings", json=settings_to_update)
     assert response_update.status_code == 200
-    update_result = response_update.json()
-    # Assuming the success message might vary or not be critical for this test, 
-    # focusing on data verification. If a specific message is guaranteed, assert it.
-    # assert update_result.get("message") == "Settings updated successfully" 
-
-    # 3. Get updated settings and verify changes
-    response_updated = client.get("/api/settings")
-    assert response_updated.status_code == 200
-    final_settings = response_updated.json()
+    final_settings = response_update.json()
 
     assert final_settings["notificationInterval"] == updated_notification_interval
     
@@ -161,17 +112,13 @@ def test_create_activity(client):
     assert activity["description"] == "Test activity for creation"
     assert "id" in activity
 
-def test_get_activity(client):
+def test_get_activity(client, sample_activity):
     """Test retrieving a specific activity."""
-    # First create an activity to retrieve
-    activity = create_test_activity(client, "Test activity for retrieval")
-    
-    # Now retrieve it
-    response = client.get(f"/api/activities/{activity['id']}")
+    response = client.get(f"/api/activities/{sample_activity['id']}")
     assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
     data = response.json()
-    assert data["id"] == activity["id"]
-    assert data["description"] == "Test activity for retrieval"
+    assert data["id"] == sample_activity["id"]
+    assert data["description"] == sample_activity["description"]
 
 def test_update_activity(client):
     """Test updating an existing activity."""
@@ -189,10 +136,9 @@ def test_update_activity(client):
     response = client.put(f"/api/activities/{activity['id']}", json=update_data)
     assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
     
-    # Verify the update
-    response = client.get(f"/api/activities/{activity['id']}")
-    assert response.status_code == 200
+    # Verify the update; the PUT response is the refreshed database row
     data = response.json()
+    assert data["id"] == activity["id"]
     assert data["description"] == "Test activity after update"
     assert data["category"] == "Personal"
     assert data["group"] == "Other Group"
@@ -219,6 +165,60 @@ def test_delete_activity(client):
     response = client.get(f"/api/activities/{activity_id}")
     assert response.status_code == 404  # Should be 404 Not Found after deletion
 
+ANNUAL_BUCKETS_YEAR = 2031
+
+def assert_annual_buckets_fresh(db, year=ANNUAL_BUCKETS_YEAR):
+    """The stored annual buckets must match a fresh SQL aggregate of the year."""
+    start = datetime(year, 1, 1)
+    end = datetime(year + 1, 1, 1)
+    _, stored = load_annual_buckets(db, year)
+    assert stored is not None, "Annual buckets should be stored"
+    _, _, _, daily_breakdown = aggregate_activity_buckets(db, start, end)
+    assert stored["days"] == {day: bucket.model_dump() for day, bucket in daily_breakdown.items()}
+    assert stored["fingerprint"] == annual_fingerprint(db, start, end)
+
+def test_annual_buckets_follow_activity_writes(client, db):
+    """Creating, updating and deleting activities keeps the stored annual buckets exact."""
+    def create(timestamp, duration_minutes):
+        response = client.post("/api/activities", json={
+            "timestamp": timestamp,
+            "description": "Annual bucket activity",
+            "category": "Work",
+            "group": "Test Group",
+            "duration_minutes": duration_minutes
+        })
+        assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
+        return response.json()["id"]
+    
+    first_id = create(f"{ANNUAL_BUCKETS_YEAR}-03-01T09:00:00", 60)
+    
+    # Reading the report stores the buckets that later writes patch
+    response = client.get(f"/api/reports/annual-report?date={ANNUAL_BUCKETS_YEAR}-01-01")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
+    assert_annual_buckets_fresh(db)
+    
+    second_id = create(f"{ANNUAL_BUCKETS_YEAR}-03-01T10:00:00", 45)
+    assert_annual_buckets_fresh(db)
+    
+    # Move the second activity to another group and category
+    response = client.put(f"/api/activities/{second_id}", json={
+        "group": "Other Group",
+        "category": "Personal",
+        "duration_minutes": 20
+    })
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
+    assert_annual_buckets_fresh(db)
+    
+    response = client.delete(f"/api/activities/{first_id}")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
+    assert_annual_buckets_fresh(db)
+    
+    # The stale rendered report is rebuilt from the patched buckets
+    response = client.get(f"/api/reports/annual-report?date={ANNUAL_BUCKETS_YEAR}-01-01")
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}. Response: {response.text}"
+    assert "html_report" in response.json()
+    assert_annual_buckets_fresh(db)
+
 def test_generate_weekly_report(client, db):
     """Test triggering weekly report generation with test data."""
     # Add test activity data
@@ -286,19 +286,8 @@ def test_read_llm_api(client):
     assert "response" in data
     assert test_text in data["response"]  # Check if the response contains our test text
 
-def test_activity_logs_endpoint(client):
+def test_activity_logs_endpoint(client, sample_activity):
     """Test the activity logs endpoint with various filters."""
-    # Create a test activity
-    activity_data = {
-        "timestamp": "2023-01-01T10:00:00",
-        "description": "Test activity for logs",
-        "category": "Work",
-        "group": "Test Group",
-        "duration_minutes": 45
-    }
-    create_response = client.post("/api/activities", json=activity_data)
-    assert create_response.status_code == 200
-    
     # Test without date filter (should return all activities)
     response = client.get("/api/activity-logs")
     assert response.status_code == 200
@@ -310,28 +299,17 @@ def test_activity_logs_endpoint(client):
     assert response.status_code == 200
     logs = response.json()
     assert isinstance(logs, list)
-    assert any(log.get("description") == "Test activity for logs" for log in logs)
+    assert any(log.get("description") == sample_activity["description"] for log in logs)
     
     # Test with date filter that shouldn't match
     response = client.get("/api/activity-logs?date=2022-12-31")
     assert response.status_code == 200
     logs = response.json()
-    assert not any(log.get("description") == "Test activity for logs" for log in logs)
+    assert not any(log.get("description") == sample_activity["description"] for log in logs)
 
-def test_generate_daily_report(client):
+def test_generate_daily_report(client, sample_activity):
     """Test generating a daily report."""
-    # First, create a test activity to ensure we have data
-    activity_data = {
-        "timestamp": "2023-01-01T10:00:00",
-        "description": "Test activity for daily report",
-        "category": "Work",
-        "group": "Test Group",
-        "duration_minutes": 60
-    }
-    create_response = client.post("/api/activities", json=activity_data)
-    assert create_response.status_code == 200, "Failed to create test activity"
-    
-    # Test with specific date that matches our test activity
+    # Test with specific date that matches the shared test activity
     response = client.post(
         "/api/reports/generate-daily",
         json={"date": "2023-01-01"}
@@ -373,18 +351,16 @@ def test_error_cases(client):
     assert response.status_code >= 400, \
         f"Expected error status code, got {response.status_code}"
 
-def test_list_reports_endpoints(client):
-    """Test the list-reports endpoints."""
-    for period in ["daily", "weekly", "monthly", "quarterly", "annual"]:
-        response = client.get(f"/api/reports/list-reports/{period}")
-        assert response.status_code == 200
-        data = response.json()
-        assert "reports" in data
-        assert isinstance(data["reports"], list)
-        
-        # Test with invalid period
-        response = client.get("/api/reports/list-reports/invalid-period")
-        assert response.status_code != 500  # Shouldn't cause a server error
+def test_list_reports_invalid_period(client):
+    """An unknown report type is rejected instead of causing a server error."""
+    response = client.get("/api/reports/list-reports/invalid-period")
+    assert response.status_code == 400
+
+def test_export_csv_defaults_to_yesterday(client):
+    """Test exporting a daily report without a date falls back to yesterday's report."""
+    response = client.get("/api/reports/export-csv/daily")
+    # 404 when yesterday has no report, but never a server error
+    assert response.status_code in [200, 404], f"Unexpected status {response.status_code}. Response: {response.text}"
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -8,7 +8,8 @@ import os
 import json
 import asyncio
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import select
 from reports import generate_weekly_report
 from models import SessionLocal, ActivityLog
 
@@ -31,25 +32,33 @@ async def test_weekly_report():
     
     try:
         # Query the database for activity logs in the specified date range
-        from datetime import datetime, time
         start_datetime = datetime.combine(start_date, time.min)  # Start of day
-        end_datetime = datetime.combine(end_date, time.max)      # End of day
+        end_datetime = datetime.combine(end_date + timedelta(days=1), time.min)  # Start of the next day
         
-        logs = db.query(ActivityLog).filter(
+        # Select plain columns and stream the rows in batches instead of
+        # hydrating every ActivityLog object up front
+        stmt = select(
+            ActivityLog.group,
+            ActivityLog.category,
+            ActivityLog.timestamp,
+            ActivityLog.duration_minutes,
+            ActivityLog.description
+        ).where(
             ActivityLog.timestamp >= start_datetime,
-            ActivityLog.timestamp <= end_datetime
-        ).all()
+            ActivityLog.timestamp < end_datetime
+        )
+        rows = db.execute(stmt).yield_per(1000)
         
-        logger.info(f"Found {len(logs)} logs in date range")
-        
-        # Convert logs to the format expected by the report generator
+        # Convert rows to the format expected by the report generator
         logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
+            "group": group,
+            "category": category,
+            "timestamp": timestamp.isoformat(sep=' ', timespec='milliseconds'),
+            "duration_minutes": duration_minutes,
+            "description": description
+        } for group, category, timestamp, duration_minutes, description in rows]
+        
+        logger.info(f"Found {len(logs_data)} logs in date range")
         
         # Generate the weekly report
         report_data = await generate_weekly_report(start_date, end_date, logs_data)
@@ -1,6 +1,6 @@
 import os
-import sqlite3
-from models import DB_PATH, Base, engine
+from sqlalchemy import inspect
+from models import DB_PATH, Base, engine, ActivityLog
 
 def validate_database():
     print(f"Validating database at: {DB_PATH}")
@@ -11,27 +11,31 @@ def validate_database():
         Base.metadata.create_all(bind=engine)
         return
     
-    # Check tables
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-    tables = cursor.fetchall()
-    print(f"Found tables: {[t[0] for t in tables]}")
+    # Check tables through the application's engine instead of a second connection
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    print(f"Found tables: {sorted(existing_tables)}")
     
     # Verify required tables exist
     required_tables = {'activity_logs', 'settings'}
-    existing_tables = {t[0] for t in tables}
     
     if not required_tables.issubset(existing_tables):
         missing = required_tables - existing_tables
         print(f"Missing tables: {missing}")
         print("Creating missing tables...")
         Base.metadata.create_all(bind=engine)
+        inspector = inspect(engine)
     else:
         print("All required tables exist")
     
-    conn.close()
+    # Verify the report date-range index exists (older databases predate it)
+    existing_indexes = {i["name"] for i in inspector.get_indexes('activity_logs')}
+    for index in ActivityLog.__table__.indexes:
+        if index.name in existing_indexes:
+            print(f"Index {index.name} exists")
+        else:
+            print(f"Missing index {index.name}, creating it...")
+            index.create(bind=engine, checkfirst=True)
 
 if __name__ == "__main__":
     validate_database()
\ No newline at end of file
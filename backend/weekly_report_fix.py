@@ -1,10 +1,9 @@
-import json
 import logging
 import os
-from datetime import datetime, date, time
-from sqlalchemy import and_
-from .models import SessionLocal, ActivityLog
-from .report_templates import generate_html_report, ChartData, DailyTimeBreakdown
+from collections import Counter
+from datetime import datetime, date
+from functools import lru_cache
+from .report_templates import generate_html_report, DailyTimeBreakdown
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +13,45 @@ logger = logging.getLogger(__name__)
 REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "reports")
 WEEKLY_REPORTS_DIR = os.path.join(REPORTS_DIR, "weekly")
 
+@lru_cache(maxsize=512)
+def _parse_log_date(timestamp):
+    """Parse a non-standard timestamp string into a YYYY-MM-DD date, or None."""
+    # fromisoformat is a C fast path covering most ISO 8601 variants; strptime
+    # only has to handle what it rejects (e.g. unpadded months and days)
+    try:
+        return datetime.fromisoformat(timestamp).date().isoformat()
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            return datetime.strptime(timestamp, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+def _log_date_from_string(timestamp):
+    """Return the YYYY-MM-DD date of a log timestamp string, or None."""
+    # Stored timestamps always start with the ISO date, so slicing avoids
+    # strptime for every row; anything else goes through the cached parser
+    if (len(timestamp) >= 10 and timestamp[4] == "-" and timestamp[7] == "-"
+            and timestamp[:4].isdigit() and timestamp[5:7].isdigit() and timestamp[8:10].isdigit()):
+        return timestamp[:10]
+    return _parse_log_date(timestamp)
+
+@lru_cache(maxsize=64)
+def _empty_report(start_date, end_date):
+    """Render the "No Data" weekly report, which only depends on the dates."""
+    return generate_html_report(
+        start_date=start_date,
+        end_date=end_date,
+        total_time=0,
+        time_by_group={"No Data": 0},
+        time_by_category={"No Data": 0},
+        daily_breakdown={},
+        visualizations={},
+        logs_data=[]
+    )
+
 def generate_weekly_report_html(start_date, end_date, logs_data):
     """
     Generate an HTML weekly report using the correct function signature.
@@ -28,81 +66,56 @@ def generate_weekly_report_html(start_date, end_date, logs_data):
     """
     logger.info(f"Generating weekly report HTML for {start_date} to {end_date}")
     
-    # Initialize variables
-    total_time = 0
-    time_by_group = {}
-    time_by_category = {}
-    daily_breakdown = {}
-    
-    # If no logs, create a default empty report
+    # If no logs, reuse the default empty report for this period
     if not logs_data:
-        return generate_html_report(
-            start_date=start_date,
-            end_date=end_date,
-            total_time=0,
-            time_by_group={"No Data": 0},
-            time_by_category={"No Data": 0},
-            daily_breakdown={},
-            visualizations={},
-            logs_data=[]
-        )
+        return _empty_report(start_date, end_date)
     
-    # Process logs to create time breakdowns
+    # Group the logs by (day, group, category) in a single pass; every total
+    # below is then derived from these few buckets instead of being updated
+    # row by row
+    buckets = Counter()
     for log in logs_data:
-        # Update total time
-        total_time += log["duration_minutes"]
-        
-        # Update group time with safe access
+        # Safe access for group and category
         group = log.get("group", "Uncategorized")
-        if group not in time_by_group:
-            time_by_group[group] = 0
-        time_by_group[group] += log["duration_minutes"]
-        
-        # Update category time with safe access
         category = log.get("category", "Uncategorized")
-        if category not in time_by_category:
-            time_by_category[category] = 0
-        time_by_category[category] += log["duration_minutes"]
         
-        # Update daily breakdown
-        # Handle timestamp with safe parsing - handle both string and datetime objects
+        # Work out the day once per row - strings (the common case) are
+        # checked first, datetimes skip the strftime round trip
         timestamp = log.get("timestamp")
-        if timestamp is None:
-            timestamp = "2025-01-01 00:00:00.000"
+        if isinstance(timestamp, str):
+            log_date = _log_date_from_string(timestamp)
+        elif isinstance(timestamp, datetime):
+            log_date = timestamp.date().isoformat()
+        elif timestamp is None:
+            log_date = "2025-01-01"
+        else:
+            log_date = None
+        if log_date is None:
+            # Default to today if parsing fails
+            log_date = date.today().isoformat()
         
-        # If it's already a datetime object, get the date directly
-        if isinstance(timestamp, datetime):
-            log_date = timestamp.date().strftime("%Y-%m-%d")
-        # If it's a string, parse it
-        elif isinstance(timestamp, str):
-            try:
-                log_date = datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S.%f").date().strftime("%Y-%m-%d")
-            except ValueError:
-                # Try a different format if the first one fails
-                try:
-                    log_date = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S").date().strftime("%Y-%m-%d")
-                except ValueError:
-                    # Default to today if parsing fails
-                    log_date = datetime.now().date().strftime("%Y-%m-%d")
-        if log_date not in daily_breakdown:
-            daily_breakdown[log_date] = DailyTimeBreakdown(
+        buckets[log_date, group, category] += log["duration_minutes"]
+    
+    # Roll the buckets up into the overall and per-day breakdowns
+    total_time = 0
+    time_by_group = Counter()
+    time_by_category = Counter()
+    daily_breakdown = {}
+    for (log_date, group, category), minutes in buckets.items():
+        total_time += minutes
+        time_by_group[group] += minutes
+        time_by_category[category] += minutes
+        
+        daily_time = daily_breakdown.get(log_date)
+        if daily_time is None:
+            daily_time = daily_breakdown[log_date] = DailyTimeBreakdown(
                 total_time=0,
                 time_by_group={},
                 time_by_category={}
             )
-        
-        # Update daily time
-        daily_breakdown[log_date].total_time += log["duration_minutes"]
-        
-        # Update daily group time
-        if group not in daily_breakdown[log_date].time_by_group:
-            daily_breakdown[log_date].time_by_group[group] = 0
-        daily_breakdown[log_date].time_by_group[group] += log["duration_minutes"]
-        
-        # Update daily category time
-        if category not in daily_breakdown[log_date].time_by_category:
-            daily_breakdown[log_date].time_by_category[category] = 0
-        daily_breakdown[log_date].time_by_category[category] += log["duration_minutes"]
+        daily_time.total_time += minutes
+        daily_time.time_by_group[group] = daily_time.time_by_group.get(group, 0) + minutes
+        daily_time.time_by_category[category] = daily_time.time_by_category.get(category, 0) + minutes
     
     # Create visualizations dictionary
     visualizations = {}
@@ -112,8 +125,8 @@ def generate_weekly_report_html(start_date, end_date, logs_data):
         start_date=start_date,
         end_date=end_date,
         total_time=total_time,
-        time_by_group=time_by_group,
-        time_by_category=time_by_category,
+        time_by_group=dict(time_by_group),
+        time_by_category=dict(time_by_category),
         daily_breakdown=daily_breakdown,
         visualizations=visualizations,
         logs_data=logs_data
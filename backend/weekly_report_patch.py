@@ -6,19 +6,14 @@ Run this script to apply the fix to the reports.py file.
 import os
 import re
 
-def apply_patch():
-    # Path to the reports.py file
-    reports_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports.py")
-    
-    # Read the current content of the file
-    with open(reports_file, 'r') as f:
-        content = f.read()
-    
-    # Find the weekly report generation code
-    pattern = r'# Generate HTML report with embedded charts\s+html_report = generate_html_report\(start_date, end_date, total_time, time_by_group,\s+time_by_category, daily_breakdown, visualizations, logs_data\)'
-    
-    # Replacement code that uses the correct function signature
-    replacement = """# Generate HTML report with embedded charts
+# Weekly report generation code to replace
+_PATCH_RE = re.compile(
+    r'# Generate HTML report with embedded charts\s+html_report = generate_html_report\(start_date, end_date, total_time, time_by_group,\s+time_by_category, daily_breakdown, visualizations, logs_data\)',
+    re.MULTILINE
+)
+
+# Replacement code that uses the correct function signature
+_REPLACEMENT = """# Generate HTML report with embedded charts
             # Import the report_templates module to ensure we have the latest version
             from report_templates import generate_html_report
             
@@ -39,9 +34,29 @@ def apply_patch():
             
             # Log the HTML report length to verify it's not empty
             logger.info(f"Generated weekly HTML report with length: {len(html_report)}")"""
+
+# Only present once the weekly block has been patched (the plain import also
+# appears in other, unpatched handlers)
+_PATCHED_MARKER = "Generated weekly HTML report with length"
+
+def apply_patch():
+    # Path to the reports.py file
+    reports_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports.py")
+    
+    # Read the current content of the file
+    with open(reports_file, 'r') as f:
+        content = f.read()
+    
+    # Nothing to do if the patch is already in place
+    if _PATCHED_MARKER in content:
+        print("Patch already applied.")
+        return
     
     # Apply the replacement
-    new_content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+    new_content, replaced = _PATCH_RE.subn(_REPLACEMENT, content)
+    if not replaced:
+        print("Weekly report code not found, nothing to patch.")
+        return
     
     # Write the updated content back to the file
     with open(reports_file, 'w') as f:
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
+import colorsys
 import os
 import json
 import logging
 from datetime import datetime, date, time, timedelta
-from sqlalchemy import and_
+from functools import lru_cache
+from operator import itemgetter
+from sqlalchemy import func
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -13,6 +16,23 @@ logger = logging.getLogger(__name__)
 from backend.models import SessionLocal, ActivityLog, Settings
 from backend.report_templates import generate_html_report, ChartData, DailyTimeBreakdown
 
+@lru_cache(maxsize=32)
+def get_distinct_colors(n):
+    """Return n evenly spaced RGBA colors, computed once per palette size."""
+    hsv_to_rgb = colorsys.hsv_to_rgb
+    return tuple(
+        f"rgba({int(r * 255)}, {int(g * 255)}, {int(b * 255)}, 0.7)"
+        for r, g, b in (hsv_to_rgb(i / n, 0.7, 0.9) for i in range(n))
+    )
+
+@lru_cache(maxsize=64)
+def get_stepped_colors(n, red_step, green_step, blue_step):
+    """Return n RGBA colors whose channels advance by fixed steps (mod 255)."""
+    return tuple(
+        f"rgba({(i * red_step) % 255}, {(i * green_step) % 255}, {(i * blue_step) % 255}, 0.7)"
+        for i in range(n)
+    )
+
 def test_weekly_report():
     """
     Generate a test weekly report to verify the combined visualization functionality.
@@ -31,61 +51,76 @@ def test_weekly_report():
     try:
         # Convert date objects to datetime objects for database query
         start_datetime = datetime.combine(start_date, time.min)  # Start of day
-        end_datetime = datetime.combine(end_date, time.max)      # End of day
+        end_datetime = datetime.combine(end_date + timedelta(days=1), time.min)  # Exclusive upper bound
+        in_range = (
+            ActivityLog.timestamp >= start_datetime,
+            ActivityLog.timestamp < end_datetime
+        )
         
-        # Query the database for activity logs in the specified date range
-        logs = db.query(ActivityLog).filter(
-            and_(
-                ActivityLog.timestamp >= start_datetime,
-                ActivityLog.timestamp <= end_datetime
-            )
+        # Let SQLite sum the durations per (day, group, category); the totals
+        # below are rolled up from these few rows
+        buckets = db.query(
+            func.date(ActivityLog.timestamp),
+            ActivityLog.group,
+            ActivityLog.category,
+            func.sum(ActivityLog.duration_minutes)
+        ).filter(*in_range).group_by(
+            func.date(ActivityLog.timestamp),
+            ActivityLog.group,
+            ActivityLog.category
         ).all()
         
-        print(f"Found {len(logs)} logs in date range")
-        
         # Check if we have any logs
-        if not logs:
+        if not buckets:
             print(f"No activity logs found for week {start_date} to {end_date}")
             return
         
-        # Convert logs to the format expected by the report generator
-        logs_data = [{
-            "group": log.group,
-            "category": log.category,
-            "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
-            "duration_minutes": log.duration_minutes,
-            "description": log.description
-        } for log in logs]
-        
         # Calculate time by group and category
+        total_time = 0
         time_by_group = {}
         time_by_category = {}
         daily_breakdown = {}
         
-        # Process logs to calculate time distributions
-        for log in logs_data:
-            group = log.get("group", "Uncategorized")
-            category = log.get("category", "Uncategorized")
-            duration = log.get("duration_minutes", 0)
-            log_date = log.get("timestamp", "").split()[0]  # Extract date part
+        for log_date, group, category, duration in buckets:
+            group = group or "Uncategorized"
+            category = category or "Uncategorized"
             
-            # Update time by group
+            total_time += duration
             time_by_group[group] = time_by_group.get(group, 0) + duration
-            
-            # Update time by category
             time_by_category[category] = time_by_category.get(category, 0) + duration
             
             # Update daily breakdown
-            if log_date not in daily_breakdown:
-                daily_breakdown[log_date] = DailyTimeBreakdown(
+            daily_time = daily_breakdown.get(log_date)
+            if daily_time is None:
+                daily_time = daily_breakdown[log_date] = DailyTimeBreakdown(
                     total_time=0,
                     time_by_group={},
                     time_by_category={}
                 )
-            
-            daily_breakdown[log_date].total_time += duration
-            daily_breakdown[log_date].time_by_group[group] = daily_breakdown[log_date].time_by_group.get(group, 0) + duration
-            daily_breakdown[log_date].time_by_category[category] = daily_breakdown[log_date].time_by_category.get(category, 0) + duration
+            daily_time.total_time += duration
+            daily_time.time_by_group[group] = daily_time.time_by_group.get(group, 0) + duration
+            daily_time.time_by_category[category] = daily_time.time_by_category.get(category, 0) + duration
+        
+        # The raw activity table still lists every log, so fetch just the
+        # columns it renders
+        logs = db.query(
+            ActivityLog.group,
+            ActivityLog.category,
+            ActivityLog.timestamp,
+            ActivityLog.duration_minutes,
+            ActivityLog.description
+        ).filter(*in_range).all()
+        
+        print(f"Found {len(logs)} logs in date range")
+        
+        # Convert logs to the format expected by the report generator
+        logs_data = [{
+            "group": log.group,
+            "category": log.category,
+            "timestamp": log.timestamp.isoformat(sep=" ", timespec="milliseconds"),
+            "duration_minutes": log.duration_minutes,
+            "description": log.description
+        } for log in logs]
         
         # Create visualizations data
         visualizations = {
@@ -105,7 +140,7 @@ def test_weekly_report():
                 datasets=[{
                     "label": "Minutes",
                     "data": list(time_by_group.values()),
-                    "backgroundColor": [f"rgba({(i*50)%255}, {(i*100)%255}, {(i*150)%255}, 0.7)" for i in range(len(time_by_group))]
+                    "backgroundColor": list(get_stepped_colors(len(time_by_group), 50, 100, 150))
                 }]
             ),
             "category_distribution": ChartData(
@@ -115,22 +150,14 @@ def test_weekly_report():
                 datasets=[{
                     "label": "Minutes",
                     "data": list(time_by_category.values()),
-                    "backgroundColor": [f"rgba({(i*70)%255}, {(i*120)%255}, {(i*170)%255}, 0.7)" for i in range(len(time_by_category))]
+                    "backgroundColor": list(get_stepped_colors(len(time_by_category), 70, 120, 170))
                 }]
             )
         }
         
         # Get the settings to understand category-group relationships
-        import sqlite3
-        conn = sqlite3.connect(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend', 'activity_logs.db'))
-        cursor = conn.cursor()
-        cursor.execute('SELECT categories FROM settings LIMIT 1')
-        result = cursor.fetchone()
-        if result and result[0]:
-            categories_config = json.loads(result[0])
-        else:
-            categories_config = []
-        conn.close()
+        categories_json = db.query(Settings.categories).limit(1).scalar()
+        categories_config = json.loads(categories_json) if categories_json else []
         
         # Create a mapping of groups to their categories
         group_to_category = {}
@@ -139,27 +166,15 @@ def test_weekly_report():
             for group_name in cat_config.get('groups', []):
                 group_to_category[group_name] = cat_name
         
-        # Organize groups by category
+        # Organize groups by category; walking the groups busiest-first once
+        # leaves every category's list already in display order
         groups_by_category = {}
-        for group, group_time in time_by_group.items():
+        for group, group_time in sorted(time_by_group.items(), key=itemgetter(1), reverse=True):
             category = group_to_category.get(group, 'Other')
             if category not in groups_by_category:
                 groups_by_category[category] = []
             groups_by_category[category].append({'name': group, 'time': group_time})
         
-        # Generate distinct colors for groups
-        import colorsys
-        def get_distinct_colors(n):
-            colors = []
-            for i in range(n):
-                hue = i / n
-                saturation = 0.7
-                value = 0.9
-                rgb = colorsys.hsv_to_rgb(hue, saturation, value)
-                rgba = f"rgba({int(rgb[0] * 255)}, {int(rgb[1] * 255)}, {int(rgb[2] * 255)}, 0.7)"
-                colors.append(rgba)
-            return colors
-        
         # Get all unique groups
         all_groups = list(time_by_group.keys())
         group_colors = get_distinct_colors(len(all_groups))
@@ -168,19 +183,16 @@ def test_weekly_report():
         # Create datasets for the combined chart
         combined_datasets = []
         categories = list(time_by_category.keys())
+        category_count = len(categories)
         
         # For each category, create datasets for each of its groups
-        for category in categories:
-            category_groups = groups_by_category.get(category, [])
-            category_groups.sort(key=lambda x: x['time'], reverse=True)
-            
-            for group_info in category_groups:
+        for category_index, category in enumerate(categories):
+            for group_info in groups_by_category.get(category, ()):
                 group_name = group_info['name']
                 group_time = group_info['time']
                 
                 # Create data array with zeros for all categories except this one
-                data = [0] * len(categories)
-                category_index = categories.index(category)
+                data = [0] * category_count
                 data[category_index] = group_time
                 
                 combined_datasets.append({
@@ -201,7 +213,6 @@ def test_weekly_report():
         )
         
         # Generate the HTML report
-        total_time = sum(log.get("duration_minutes", 0) for log in logs_data)
         html_report = generate_html_report(
             start_date=start_date,
             end_date=end_date,
@@ -220,10 +231,10 @@ def test_weekly_report():
         report_filename = f"test_weekly_report_{start_date.strftime('%Y-%m-%d')}_to_{end_date.strftime('%Y-%m-%d')}.html"
         report_path = os.path.join(reports_dir, report_filename)
         
-        with open(report_path, 'w') as f:
+        with open(report_path, 'w', encoding='utf-8') as f:
             f.write(html_report)
         
-        print(f"Weekly report saved to: {report_path}")
+        print(f"Weekly report saved to: {report_path} ({os.path.getsize(report_path)} bytes)")
         
     except Exception as e:
         print(f"Error generating weekly report: {e}")
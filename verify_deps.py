@@ -1,13 +1,28 @@
 import sys
 import logging
 from pathlib import Path
-from packaging.requirements import Requirement
-import pkg_resources
+from importlib.metadata import distributions
+from packaging.requirements import Requirement, InvalidRequirement
+from packaging.utils import canonicalize_name
+from packaging.version import Version, InvalidVersion
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def check_requirements(req_file: Path) -> bool:
+def get_installed_versions() -> dict:
+    """Snapshot installed distributions as {canonical name: Version}"""
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        try:
+            installed[canonicalize_name(name)] = Version(dist.version)
+        except InvalidVersion:
+            logger.warning(f"Skipping {name}: unparseable version {dist.version!r}")
+    return installed
+
+def check_requirements(req_file: Path, installed: dict) -> bool:
     """Check if all requirements in a file are installed"""
     if not req_file.exists():
         logger.error(f"Requirements file not found: {req_file}")
@@ -22,10 +37,17 @@ def check_requirements(req_file: Path) -> bool:
                 line = line.strip()
                 if line and not line.startswith('#') and not line.startswith('-r'):
                     try:
-                        pkg_resources.require(line)
-                    except (pkg_resources.DistributionNotFound, 
-                           pkg_resources.VersionConflict) as e:
+                        req = Requirement(line)
+                    except InvalidRequirement as e:
                         missing.append(f"{line} ({str(e)})")
+                        continue
+                    if req.marker and not req.marker.evaluate():
+                        continue
+                    version = installed.get(canonicalize_name(req.name))
+                    if version is None:
+                        missing.append(f"{line} (not installed)")
+                    elif req.specifier and not req.specifier.contains(version, prereleases=True):
+                        missing.append(f"{line} (found {version})")
     except Exception as e:
         logger.error(f"Error reading {req_file}: {e}")
         return False
@@ -52,9 +74,10 @@ def main():
 
     logger.info(f"Project root: {root}")
     all_ok = True
+    installed = get_installed_versions()
     
     for req_file in req_files:
-        if not check_requirements(req_file):
+        if not check_requirements(req_file, installed):
             all_ok = False
     
     if all_ok: